@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Mide el tiempo de importación de mimodulo y verifica que no cargue dependencias pesadas.
+
+Cada medición importa mimodulo en un proceso nuevo (para no medir módulos ya cargados) y
+revisa sys.modules después de la importación. El script termina con código 1 si alguno de
+matplotlib, statsmodels, sklearn o scipy quedó cargado, o si la mediana del tiempo supera
+el máximo indicado.
+
+Uso:
+    python bench_import.py [--repeticiones 5] [--max-segundos 2.0]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PESADOS = ('matplotlib', 'statsmodels', 'sklearn', 'scipy')
+
+CODIGO = """
+import json, sys, time
+comienzo = time.perf_counter()
+import mimodulo
+tiempo = time.perf_counter() - comienzo
+cargados = sorted({nombre.split('.')[0] for nombre in sys.modules} & set(%r))
+print(json.dumps({'tiempo': tiempo, 'cargados': cargados}))
+""" % (PESADOS,)
+
+
+def medir_importacion():
+    """
+    Importa mimodulo en un proceso nuevo.
+
+    Returns:
+    dict: Tiempo de importación en segundos y dependencias pesadas cargadas.
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    salida = subprocess.run([sys.executable, '-c', CODIGO], cwd=directorio, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(salida.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--max-segundos', type=float, default=2.0)
+    args = parser.parse_args()
+
+    mediciones = [medir_importacion() for _ in range(args.repeticiones)]
+    tiempos = [medicion['tiempo'] for medicion in mediciones]
+    cargados = sorted({nombre for medicion in mediciones for nombre in medicion['cargados']})
+    mediana = statistics.median(tiempos)
+    print(f'import mimodulo: mediana {mediana:.3f} s, mínimo {min(tiempos):.3f} s ({args.repeticiones} repeticiones)')
+
+    errores = []
+    if cargados:
+        errores.append(f'dependencias pesadas cargadas al importar: {", ".join(cargados)}')
+    if mediana > args.max_segundos:
+        errores.append(f'la importación tarda {mediana:.3f} s (máximo {args.max_segundos} s)')
+    for error in errores:
+        print('ERROR:', error)
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Compara el ajuste OLS de RegresionLineal con motor='numpy' (QR) contra motor='statsmodels'.
+
+Para cada tamaño de datos ajusta el mismo modelo con ambos motores, verifica que params, bse,
+mse_resid, R2 y R2 ajustado coincidan (con tolerancia relativa) y mide el tiempo por ajuste.
+Antes de cada ajuste se invalida la matriz de diseño guardada, así ambos motores la arman.
+El script termina con código 1 si alguna comparación falla.
+
+Uso:
+    python bench_ols.py [--repeticiones 5] [--tolerancia 1e-8] [--semilla 0]
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from mimodulo import RegresionLineal
+
+TAMANOS = [(1_000, 5), (100_000, 10), (200_000, 50)]
+
+
+def generar_datos(n, k, generador):
+    """
+    Genera un DataFrame con k variables independientes y la respuesta lineal 'y' con ruido normal.
+
+    Returns:
+    DataFrame: Datos con columnas x0..x{k-1} e y.
+    """
+    x = generador.normal(size=(n, k))
+    datos = pd.DataFrame(x, columns=[f'x{i}' for i in range(k)])
+    datos['y'] = 1.0 + x @ generador.normal(size=k) + generador.normal(size=n)
+    return datos
+
+
+def medir(modelo, motor, repeticiones):
+    """
+    Ajusta el modelo repeticiones veces con el motor indicado.
+
+    Returns:
+    tuple: Resultados del último ajuste y mediana del tiempo por ajuste en segundos.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        modelo.invalidar_cache()
+        comienzo = time.perf_counter()
+        resultados = modelo.ajustar(motor=motor)
+        tiempos.append(time.perf_counter() - comienzo)
+    return resultados, float(np.median(tiempos))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--tolerancia', type=float, default=1e-8)
+    parser.add_argument('--semilla', type=int, default=0)
+    args = parser.parse_args()
+
+    generador = np.random.default_rng(args.semilla)
+    errores = []
+    print(f'{"n":>9} {"k":>4} {"statsmodels (s)":>16} {"numpy (s)":>10} {"aceleración":>12} {"máx. dif. rel.":>15}')
+    for n, k in TAMANOS:
+        modelo = RegresionLineal(generar_datos(n, k, generador), None)
+        referencia, tiempo_sm = medir(modelo, 'statsmodels', args.repeticiones)
+        resultados, tiempo_np = medir(modelo, 'numpy', args.repeticiones)
+        diferencias = {}
+        for atributo in ('params', 'bse', 'mse_resid', 'rsquared', 'rsquared_adj'):
+            esperado = np.asarray(getattr(referencia, atributo), dtype=float)
+            obtenido = np.asarray(getattr(resultados, atributo), dtype=float)
+            diferencias[atributo] = np.max(np.abs(obtenido - esperado) / np.maximum(np.abs(esperado), 1e-300))
+            if not diferencias[atributo] <= args.tolerancia:
+                errores.append(f'n={n}, k={k}: {atributo} difiere en {diferencias[atributo]:.2e}')
+        print(f'{n:>9} {k:>4} {tiempo_sm:>16.4f} {tiempo_np:>10.4f} {tiempo_sm / tiempo_np:>11.1f}x'
+              f' {max(diferencias.values()):>15.2e}')
+    for error in errores:
+        print('ERROR:', error)
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
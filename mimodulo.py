@@ -7,12 +7,97 @@ Original file is located at
     https://colab.research.google.com/drive/12gH5E3T8xXYu06Vq2dg3vB3yuwRJZhwN
 """
 import numpy as np
-import matplotlib.pyplot as plt
-import statsmodels.api as sm
 import pandas as pd
-from scipy.stats import norm, chi2
-from sklearn.metrics import confusion_matrix, roc_curve, roc_auc_score
-import random
+import os
+import time
+import hashlib
+from types import SimpleNamespace
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+class FuenteDatos:
+    """
+    Una clase para leer datos numéricos por bloques sin cargarlos enteros en memoria.
+
+    Admite arreglos y np.memmap, archivos .npy (abiertos con mmap_mode='r'), archivos .parquet
+    y tablas de Arrow. Cada bloque se convierte a float64 por separado.
+
+    Atributos:
+    arreglo (numpy.ndarray): El arreglo subyacente (mapeado en memoria para .npy), o None para Parquet/Arrow.
+    columnas (list): Nombres de las columnas leídas (o None para arreglos).
+    tam_bloque (int): Cantidad de filas por bloque.
+    """
+
+    def __init__(self, origen, columnas=None, tam_bloque=2 ** 20):
+        """
+        Inicializa la fuente a partir de un arreglo, una ruta o una tabla de Arrow.
+
+        Args:
+        origen (numpy.ndarray, str o pyarrow.Table): Los datos o la ruta al archivo .npy o .parquet.
+        columnas (list, opcional): Columnas a leer de un archivo Parquet o tabla de Arrow. Por defecto, todas las numéricas.
+        tam_bloque (int): Cantidad de filas por bloque. Por defecto es 2 ** 20.
+        """
+        self.tam_bloque = tam_bloque
+        self.columnas = columnas
+        self.arreglo = None
+        self.tabla = None
+        self.parquet = None
+        if isinstance(origen, (str, os.PathLike)):
+            ruta = os.fspath(origen)
+            if ruta.endswith('.npy'):
+                self.arreglo = np.load(ruta, mmap_mode='r')
+            elif ruta.endswith('.parquet'):
+                try:
+                    import pyarrow.parquet as pq
+                except ImportError:
+                    raise Exception("Se necesita pyarrow para leer archivos Parquet.")
+                self.parquet = pq.ParquetFile(ruta)
+                esquema = self.parquet.schema_arrow
+            else:
+                raise Exception(f"Formato no soportado: {ruta}. Se admiten archivos .npy y .parquet.")
+        elif hasattr(origen, 'to_batches'):
+            self.tabla = origen
+            esquema = origen.schema
+        else:
+            self.arreglo = np.asarray(origen)
+        if self.arreglo is None and self.columnas is None:
+            import pyarrow as pa
+            self.columnas = [campo.name for campo in esquema
+                             if pa.types.is_integer(campo.type) or pa.types.is_floating(campo.type)]
+
+    @staticmethod
+    def es_fuente(datos):
+        """
+        Indica si datos debe leerse a través de una FuenteDatos (ruta, tabla de Arrow o FuenteDatos).
+
+        Args:
+        datos (object): Los datos recibidos por un constructor.
+
+        Returns:
+        bool: True si datos es una ruta, una tabla de Arrow o una FuenteDatos.
+        """
+        return isinstance(datos, (FuenteDatos, str, os.PathLike)) or hasattr(datos, 'to_batches')
+
+    def bloques(self):
+        """
+        Recorre los datos por bloques de filas.
+
+        Yields:
+        numpy.ndarray: Bloques float64 de forma (filas, columnas).
+        """
+        if self.arreglo is not None:
+            for inicio in range(0, len(self.arreglo), self.tam_bloque):
+                bloque = np.asarray(self.arreglo[inicio:inicio + self.tam_bloque], dtype=float)
+                yield bloque[:, np.newaxis] if bloque.ndim == 1 else bloque
+            return
+        if self.parquet is not None:
+            lotes = self.parquet.iter_batches(batch_size=self.tam_bloque, columns=self.columnas)
+        else:
+            lotes = self.tabla.select(self.columnas).to_batches(max_chunksize=self.tam_bloque)
+        for lote in lotes:
+            yield np.column_stack([np.asarray(columna.to_numpy(zero_copy_only=False), dtype=float)
+                                   for columna in lote.columns])
 
 class ResumenNumerico:
     """
@@ -26,10 +111,43 @@ class ResumenNumerico:
         """
         Inicializa la clase ResumenNumerico con un DataFrame y convierte los datos numéricos a un arreglo numpy.
 
+        Los arreglos se guardan sin copiar. Los np.memmap, las rutas a archivos .npy o .parquet y
+        las tablas de Arrow se abren como FuenteDatos (los .npy quedan mapeados en memoria) y todas
+        las estadísticas se calculan recorriendo los datos por bloques, sin cargarlos enteros en memoria.
+
         Args:
-        datos (pandas.DataFrame): Un DataFrame que contiene los datos.
+        datos (pandas.DataFrame, numpy.ndarray, str o FuenteDatos): Los datos o su fuente.
+        """
+        self.fuente = None
+        self.acumuladores = {}
+        self.bosquejos = {}
+        if isinstance(datos, pd.DataFrame):
+            self.datos = datos.select_dtypes(include=np.number).to_numpy()
+        elif FuenteDatos.es_fuente(datos) or isinstance(datos, np.memmap):
+            self.fuente = datos if isinstance(datos, FuenteDatos) else FuenteDatos(datos)
+            self.datos = self.fuente.arreglo
+        else:
+            self.datos = np.asarray(datos)
+            if self.datos.ndim == 1:
+                self.datos = self.datos[:, np.newaxis]
+
+    @staticmethod
+    def acumular(bloques, acumulador=None):
+        """
+        Resume por columna una secuencia de bloques en una sola pasada, sin tener todos los datos en memoria.
+
+        Args:
+        bloques (iterable): Bloques de datos (DataFrames o arreglos), por ejemplo pd.read_csv(..., chunksize=...).
+        acumulador (AcumuladorEstadisticas, opcional): Acumulador a continuar. Por defecto se crea uno nuevo.
+
+        Returns:
+        AcumuladorEstadisticas: Acumulador con las estadísticas de todos los bloques.
         """
-        self.datos = datos.select_dtypes(include=np.number).to_numpy()
+        if acumulador is None:
+            acumulador = AcumuladorEstadisticas()
+        for bloque in bloques:
+            acumulador.actualizar(bloque)
+        return acumulador
 
     def calculo_de_media(self):
         """
@@ -38,6 +156,9 @@ class ResumenNumerico:
         Returns:
         float: La media de los datos.
         """
+        if self.fuente is not None:
+            acumulador = self.acumulador_por_bloques()
+            return np.sum(acumulador.n * acumulador.media) / np.sum(acumulador.n)
         media = np.mean(self.datos)
         return media
 
@@ -45,9 +166,14 @@ class ResumenNumerico:
         """
         Calcula la mediana de los datos.
 
+        Con datos en disco la mediana se aproxima con un BosquejoCuantiles sobre todos los valores,
+        que se guarda con bosquejo_por_bloques para no volver a leer el archivo.
+
         Returns:
         float: La mediana de los datos.
         """
+        if self.fuente is not None:
+            return self.bosquejo_por_bloques().cuantiles([0.5])[0, 0]
         mediana = np.median(self.datos)
         return mediana
 
@@ -58,39 +184,108 @@ class ResumenNumerico:
         Returns:
         float: El desvío estándar de los datos.
         """
+        if self.fuente is not None:
+            acumulador = self.acumulador_por_bloques()
+            n = np.sum(acumulador.n)
+            media = np.sum(acumulador.n * acumulador.media) / n
+            return ((np.sum(acumulador.m2) + np.sum(acumulador.n * (acumulador.media - media) ** 2)) / n) ** 0.5
         var = np.var(self.datos)
         desvio_estandar = var ** 0.5
         return desvio_estandar
 
-    def calculo_de_cuartiles(self):
+    def calculo_de_cuartiles(self, metodo='exacto', error=0.01):
         """
         Calcula los cuartiles de los datos por columna.
 
+        El método exacto selecciona, con una única llamada a np.partition sobre todas las columnas,
+        solo las posiciones que intervienen en cada cuartil (sin ordenar las columnas completas).
+        El método 'bosquejo' usa un BosquejoCuantiles, con memoria acotada y error de rango aproximado
+        error. Con datos en disco siempre se usa el bosquejo, porque el método exacto los cargaría enteros.
+
+        Args:
+        metodo (str): 'exacto' o 'bosquejo'. Por defecto es 'exacto'.
+        error (float): Error de rango admitido para metodo='bosquejo'. Por defecto es 0.01.
+
         Returns:
         list: Una lista de listas donde cada sublista contiene los cuartiles [Q1, Q2, Q3] de una columna.
         """
-        cuartiles_por_columna = []
-        for i in range(self.datos.shape[1]):
-            datos_ordenados = sorted(self.datos[:, i])  # Ordenar los datos de la columna actual
-            if len(datos_ordenados) % 4 != 0:
-                q1 = datos_ordenados[len(datos_ordenados) // 4 - 1]
-                q2 = np.median(datos_ordenados)  # Usar np.median directamente en los datos ordenados
-                q3 = datos_ordenados[len(datos_ordenados) * 3 // 4 - 1]
-            else:
-                q1 = (datos_ordenados[len(datos_ordenados) // 4 - 1] + datos_ordenados[len(datos_ordenados) // 4]) // 2
-                q2 = np.median(datos_ordenados)  # Usar np.median directamente en los datos ordenados
-                q3 = (datos_ordenados[len(datos_ordenados) * 3 // 4 - 1] + datos_ordenados[len(datos_ordenados) * 3 // 4]) // 2
-            cuartiles_por_columna.append([q1, q2, q3])
+        if metodo not in ('exacto', 'bosquejo'):
+            raise Exception(f"Método desconocido: {metodo}. Opciones: exacto, bosquejo.")
+        if self.fuente is not None:
+            return self.acumulador_por_bloques(error).bosquejo.cuantiles([0.25, 0.5, 0.75]).T.tolist()
+        if metodo == 'bosquejo':
+            bosquejo = BosquejoCuantiles(error).actualizar(self.datos)
+            return bosquejo.cuantiles([0.25, 0.5, 0.75]).T.tolist()
+        return self.cuartiles_exactos(self.datos).T.tolist()
+
+    @staticmethod
+    def cuartiles_exactos(datos):
+        """
+        Calcula los cuartiles por columna de un arreglo con una única llamada a np.partition.
+
+        Args:
+        datos (numpy.ndarray): Arreglo de forma (filas, columnas).
 
-        return cuartiles_por_columna
+        Returns:
+        numpy.ndarray: Arreglo de forma (3, columnas) con Q1, Q2 y Q3.
+        """
+        n = datos.shape[0]
+        # Posiciones (como en una lista ordenada, admitiendo índices negativos) de Q1, la mediana y Q3
+        i1, i3 = n // 4 - 1, n * 3 // 4 - 1
+        posiciones = sorted({i1 % n, (i1 + 1) % n, i3 % n, (i3 + 1) % n, (n - 1) // 2, n // 2})
+        seleccion = np.partition(datos, posiciones, axis=0)
+        q2 = (seleccion[(n - 1) // 2] + seleccion[n // 2]) / 2
+        if n % 4 != 0:
+            q1 = seleccion[i1 % n]
+            q3 = seleccion[i3 % n]
+        else:
+            q1 = (seleccion[i1] + seleccion[i1 + 1]) // 2
+            q3 = (seleccion[i3] + seleccion[i3 + 1]) // 2
+        return np.vstack([q1, q2, q3])
+
+    def calculo_de_percentiles(self, percentiles, metodo='exacto', error=0.01):
+        """
+        Calcula percentiles arbitrarios de los datos por columna.
+
+        Args:
+        percentiles (array-like): Percentiles a calcular, entre 0 y 100.
+        metodo (str): 'exacto' (np.percentile, basado en selección) o 'bosquejo'. Por defecto es 'exacto'.
+            Con datos en disco siempre se usa el bosquejo.
+        error (float): Error de rango admitido para metodo='bosquejo'. Por defecto es 0.01.
+
+        Returns:
+        numpy.ndarray: Arreglo de forma (len(percentiles), columnas) con los percentiles.
+        """
+        percentiles = np.atleast_1d(np.asarray(percentiles, dtype=float))
+        if metodo not in ('exacto', 'bosquejo'):
+            raise Exception(f"Método desconocido: {metodo}. Opciones: exacto, bosquejo.")
+        if self.fuente is not None:
+            return self.acumulador_por_bloques(error).bosquejo.cuantiles(percentiles / 100)
+        if metodo == 'bosquejo':
+            return BosquejoCuantiles(error).actualizar(self.datos).cuantiles(percentiles / 100)
+        return np.percentile(self.datos, percentiles, axis=0)
 
-    def generacion_resumen_numerico(self):
+    def generacion_resumen_numerico(self, trabajadores=None, usar_procesos=False):
         """
         Genera un resumen numérico que incluye media, mediana, desvío estándar, cuartiles, mínimo y máximo.
 
+        Si se indica trabajadores, las columnas se reparten en bloques entre un pool de hilos
+        (NumPy libera el GIL en las reducciones y en np.partition) o de procesos, y cada
+        estadística se informa por columna. Con procesos, los datos se copian una sola vez a
+        memoria compartida y cada proceso lee su bloque de columnas sin recibir una copia. Con datos
+        en disco (np.memmap, .npy, .parquet o Arrow) el resumen se calcula con resumen_por_bloques.
+
+        Args:
+        trabajadores (int, opcional): Cantidad de hilos o procesos. Por defecto el cálculo es serial y agrupa todas las columnas.
+        usar_procesos (bool): Si se usa un pool de procesos en lugar de hilos. Por defecto es False.
+
         Returns:
         dict: Un diccionario con el resumen numérico.
         """
+        if self.fuente is not None:
+            return self.resumen_por_bloques()
+        if trabajadores is not None:
+            return self.resumen_paralelo(trabajadores, usar_procesos)
         res_num = {
             'Media': self.calculo_de_media(),
             'Mediana': self.calculo_de_mediana(),
@@ -102,6 +297,135 @@ class ResumenNumerico:
 
         return res_num
 
+    def resumen_por_bloques(self, error=0.01):
+        """
+        Calcula el resumen numérico por columna recorriendo los datos por bloques.
+
+        La media, el desvío, el mínimo y el máximo son exactos; la mediana y los cuartiles se
+        aproximan con un BosquejoCuantiles. La memoria usada no depende de la cantidad de filas.
+
+        Args:
+        error (float): Error de rango admitido para la mediana y los cuartiles. Por defecto es 0.01.
+
+        Returns:
+        dict: Un diccionario con el resumen numérico, con un valor por columna en cada estadística.
+        """
+        return self.acumulador_por_bloques(error).generacion_resumen()
+
+    def acumulador_por_bloques(self, error=0.01):
+        """
+        Recorre los datos una vez por bloques y guarda el acumulador, para que las distintas
+        estadísticas de datos en disco no vuelvan a leer el archivo.
+
+        Args:
+        error (float): Error de rango del bosquejo de cuantiles. Por defecto es 0.01.
+
+        Returns:
+        AcumuladorEstadisticas: Acumulador con las estadísticas por columna y su bosquejo de cuantiles.
+        """
+        if error not in self.acumuladores:
+            fuente = self.fuente if self.fuente is not None else FuenteDatos(self.datos)
+            acumulador = AcumuladorEstadisticas(fuente.columnas, error_cuantiles=error)
+            self.acumuladores[error] = ResumenNumerico.acumular(fuente.bloques(), acumulador)
+        return self.acumuladores[error]
+
+    def bosquejo_por_bloques(self, error=0.01):
+        """
+        Recorre los datos una vez por bloques y guarda un bosquejo de cuantiles de todos los
+        valores juntos (sin separar por columna), como acumulador_por_bloques.
+
+        Args:
+        error (float): Error de rango del bosquejo de cuantiles. Por defecto es 0.01.
+
+        Returns:
+        BosquejoCuantiles: Bosquejo de una columna con todos los valores de los datos.
+        """
+        if error not in self.bosquejos:
+            fuente = self.fuente if self.fuente is not None else FuenteDatos(self.datos)
+            bosquejo = BosquejoCuantiles(error)
+            for bloque in fuente.bloques():
+                bosquejo.actualizar(bloque.reshape(-1, 1))
+            self.bosquejos[error] = bosquejo
+        return self.bosquejos[error]
+
+    def resumen_paralelo(self, trabajadores, usar_procesos=False):
+        """
+        Calcula el resumen numérico por columna repartiendo bloques de columnas entre trabajadores.
+
+        Args:
+        trabajadores (int): Cantidad de hilos o procesos.
+        usar_procesos (bool): Si se usa un pool de procesos en lugar de hilos. Por defecto es False.
+
+        Returns:
+        dict: Un diccionario con el resumen numérico, con un valor por columna en cada estadística.
+        """
+        trabajadores = max(1, int(trabajadores))
+        columnas = self.datos.shape[1]
+        cortes = np.linspace(0, columnas, min(trabajadores, max(columnas, 1)) + 1).astype(int)
+        tramos = [(a, b) for a, b in zip(cortes[:-1], cortes[1:]) if b > a]
+        if usar_procesos:
+            datos = np.asarray(self.datos, dtype=float)
+            memoria = shared_memory.SharedMemory(create=True, size=max(datos.nbytes, 1))
+            try:
+                # Orden Fortran: cada bloque de columnas queda contiguo en la memoria compartida
+                compartidos = np.ndarray(datos.shape, dtype=datos.dtype, buffer=memoria.buf, order='F')
+                compartidos[:] = datos
+                with ProcessPoolExecutor(trabajadores) as pool:
+                    partes = list(pool.map(ResumenNumerico.resumen_columnas_compartidas,
+                                           [(memoria.name, datos.shape, datos.dtype.str, a, b) for a, b in tramos]))
+                del compartidos
+            finally:
+                memoria.close()
+                memoria.unlink()
+        else:
+            with ThreadPoolExecutor(trabajadores) as pool:
+                partes = list(pool.map(lambda tramo: ResumenNumerico.resumen_columnas(self.datos[:, tramo[0]:tramo[1]]), tramos))
+        return {estad: np.concatenate([parte[estad] for parte in partes]) if estad != 'Cuartiles'
+                else [cuartiles for parte in partes for cuartiles in parte[estad]]
+                for estad in partes[0]}
+
+    @staticmethod
+    def resumen_columnas(bloque):
+        """
+        Calcula el resumen numérico de cada columna de un bloque.
+
+        Args:
+        bloque (numpy.ndarray): Arreglo de forma (filas, columnas).
+
+        Returns:
+        dict: Un diccionario con un arreglo de valores por estadística (y una lista de [Q1, Q2, Q3] por columna).
+        """
+        cuartiles = ResumenNumerico.cuartiles_exactos(bloque)
+        return {
+            'Media': np.mean(bloque, axis=0),
+            'Mediana': cuartiles[1],
+            'Desvio': np.std(bloque, axis=0),
+            'Cuartiles': cuartiles.T.tolist(),
+            'Mínimo': np.min(bloque, axis=0),
+            'Máximo': np.max(bloque, axis=0)
+        }
+
+    @staticmethod
+    def resumen_columnas_compartidas(tarea):
+        """
+        Calcula el resumen de un bloque de columnas leyendo los datos desde memoria compartida.
+
+        Args:
+        tarea (tuple): Nombre de la memoria compartida, forma y dtype del arreglo, y columnas [desde, hasta).
+
+        Returns:
+        dict: El resumen del bloque, como en resumen_columnas.
+        """
+        nombre, forma, tipo, desde, hasta = tarea
+        memoria = shared_memory.SharedMemory(name=nombre)
+        try:
+            datos = np.ndarray(forma, dtype=np.dtype(tipo), buffer=memoria.buf, order='F')
+            resumen = ResumenNumerico.resumen_columnas(datos[:, desde:hasta])
+            del datos
+        finally:
+            memoria.close()
+        return resumen
+
     def muestra_resumen(self):
         """
         Muestra el resumen numérico en la consola con los valores redondeados a 3 decimales.
@@ -110,6 +434,318 @@ class ResumenNumerico:
         for estad, valor in res_num.items():
             print(f'{estad}: {np.round(valor, 3)}')
 
+class AcumuladorEstadisticas:
+    """
+    Una clase para acumular estadísticas por columna en una sola pasada, bloque a bloque.
+
+    Usa las actualizaciones de Welford/Chan para la media y la suma de cuadrados centrada (M2),
+    de modo que dos acumuladores calculados sobre partes distintas de los datos se pueden
+    combinar de forma exacta. Los valores NaN se ignoran.
+
+    Atributos:
+    columnas (list): Nombres de las columnas (o None si los bloques son arreglos).
+    n (numpy.ndarray): Cantidad de datos no faltantes por columna.
+    media (numpy.ndarray): Media por columna.
+    m2 (numpy.ndarray): Suma de cuadrados de las desviaciones respecto de la media, por columna.
+    minimo (numpy.ndarray): Mínimo por columna.
+    maximo (numpy.ndarray): Máximo por columna.
+    """
+
+    def __init__(self, columnas=None, error_cuantiles=None):
+        """
+        Inicializa un acumulador vacío.
+
+        Args:
+        columnas (list, opcional): Nombres de las columnas.
+        error_cuantiles (float, opcional): Si se indica, también se acumula un BosquejoCuantiles con ese error
+            y el resumen incluye mediana y cuartiles aproximados.
+        """
+        self.columnas = columnas
+        self.bosquejo = BosquejoCuantiles(error_cuantiles) if error_cuantiles is not None else None
+        self.n = None
+        self.media = None
+        self.m2 = None
+        self.minimo = None
+        self.maximo = None
+
+    def actualizar(self, bloque):
+        """
+        Incorpora un bloque de datos al acumulador.
+
+        Args:
+        bloque (pandas.DataFrame o numpy.ndarray): Bloque de datos; de un DataFrame se toman solo las columnas numéricas.
+
+        Returns:
+        AcumuladorEstadisticas: El mismo acumulador, actualizado.
+        """
+        if isinstance(bloque, pd.DataFrame):
+            bloque = bloque.select_dtypes(include=np.number)
+            if self.columnas is None:
+                self.columnas = list(bloque.columns)
+            bloque = bloque.to_numpy(dtype=float)
+        else:
+            bloque = np.asarray(bloque, dtype=float)
+            if bloque.ndim == 1:
+                bloque = bloque[:, np.newaxis]
+        if self.bosquejo is not None:
+            self.bosquejo.actualizar(bloque)
+        validos = ~np.isnan(bloque)
+        n = validos.sum(axis=0).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            media = np.nansum(bloque, axis=0) / n
+            m2 = np.nansum((bloque - media) ** 2, axis=0)
+        parcial = AcumuladorEstadisticas(self.columnas)
+        parcial.bosquejo = self.bosquejo
+        parcial.n = n
+        parcial.media = np.where(n > 0, media, 0.0)
+        parcial.m2 = np.where(n > 0, m2, 0.0)
+        parcial.minimo = np.where(n > 0, np.min(np.where(validos, bloque, np.inf), axis=0), np.inf)
+        parcial.maximo = np.where(n > 0, np.max(np.where(validos, bloque, -np.inf), axis=0), -np.inf)
+        return self.combinar(parcial)
+
+    def combinar(self, otro):
+        """
+        Combina en este acumulador las estadísticas de otro (por ejemplo, de otro proceso o archivo).
+
+        Args:
+        otro (AcumuladorEstadisticas): Acumulador con las mismas columnas.
+
+        Returns:
+        AcumuladorEstadisticas: El mismo acumulador, actualizado.
+        """
+        if otro.n is None:
+            return self
+        if self.bosquejo is not None and otro.bosquejo is not None and otro.bosquejo is not self.bosquejo:
+            self.bosquejo.combinar(otro.bosquejo)
+        if self.n is None:
+            self.n, self.media, self.m2 = otro.n.copy(), otro.media.copy(), otro.m2.copy()
+            self.minimo, self.maximo = otro.minimo.copy(), otro.maximo.copy()
+            if self.columnas is None:
+                self.columnas = otro.columnas
+            return self
+        if len(otro.n) != len(self.n):
+            raise Exception("Los acumuladores deben tener la misma cantidad de columnas para combinarse.")
+        n = self.n + otro.n
+        delta = otro.media - self.media
+        with np.errstate(invalid='ignore', divide='ignore'):
+            proporcion = np.where(n > 0, otro.n / n, 0.0)
+        self.media = self.media + delta * proporcion
+        self.m2 = self.m2 + otro.m2 + delta ** 2 * self.n * proporcion
+        self.n = n
+        self.minimo = np.minimum(self.minimo, otro.minimo)
+        self.maximo = np.maximum(self.maximo, otro.maximo)
+        return self
+
+    def varianza(self, ddof=0):
+        """
+        Calcula la varianza por columna.
+
+        Args:
+        ddof (int): Grados de libertad descontados del denominador. Por defecto es 0, como np.var.
+
+        Returns:
+        numpy.ndarray: Varianza por columna.
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.m2 / (self.n - ddof)
+
+    def generacion_resumen(self):
+        """
+        Genera un resumen con la media, el desvío estándar, el mínimo y el máximo de cada columna
+        (y la mediana y los cuartiles aproximados, si el acumulador tiene un bosquejo de cuantiles).
+
+        Returns:
+        dict: Un diccionario con los valores por columna.
+        """
+        if self.n is None:
+            raise Exception("El acumulador no recibió datos.")
+        res_num = {
+            'Media': self.media,
+            'Desvio': self.varianza() ** 0.5,
+            'Mínimo': self.minimo,
+            'Máximo': self.maximo
+        }
+        if self.bosquejo is not None:
+            cuartiles = self.bosquejo.cuantiles([0.25, 0.5, 0.75])
+            res_num['Mediana'] = cuartiles[1]
+            res_num['Cuartiles'] = cuartiles.T.tolist()
+        return res_num
+
+class BosquejoCuantiles:
+    """
+    Un bosquejo de cuantiles tipo KLL, por columna, con memoria acotada y combinable entre particiones.
+
+    Los datos se guardan en niveles; cada elemento del nivel h representa 2 ** h datos. Cuando un
+    nivel supera su capacidad se ordena y se conserva uno de cada dos elementos (con desfasaje
+    aleatorio) en el nivel siguiente. La memoria es O(k) elementos por columna y el error de rango
+    de cada cuantil es del orden de error, con k = ceil(3 / error).
+
+    Los valores NaN se ignoran por columna: al ordenar quedan al final de cada nivel (se compactan
+    entre ellos) y tienen peso nulo al estimar los cuantiles, como en AcumuladorEstadisticas.
+
+    Atributos:
+    k (int): Capacidad del nivel superior.
+    niveles (list): Arreglos de forma (elementos, columnas), uno por nivel.
+    n (int): Cantidad de filas incorporadas.
+    """
+
+    def __init__(self, error=0.01, semilla=None):
+        """
+        Inicializa un bosquejo vacío.
+
+        Args:
+        error (float): Error de rango admitido (fracción de n). Por defecto es 0.01.
+        semilla (int, opcional): Semilla para los desfasajes aleatorios de la compactación.
+        """
+        self.error = error
+        self.k = max(8, int(np.ceil(3 / error)))
+        self.niveles = []
+        self.n = 0
+        self.generador = np.random.default_rng(semilla)
+
+    def capacidad(self, nivel):
+        """
+        Devuelve la capacidad de un nivel: k para el superior, decreciendo por un factor 2/3 hacia abajo.
+
+        Args:
+        nivel (int): Número de nivel.
+
+        Returns:
+        int: Cantidad máxima de elementos del nivel.
+        """
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (len(self.niveles) - 1 - nivel))))
+
+    def actualizar(self, bloque):
+        """
+        Incorpora un bloque de filas al bosquejo.
+
+        Args:
+        bloque (pandas.DataFrame o numpy.ndarray): Bloque de datos; de un DataFrame se toman solo las columnas numéricas.
+
+        Returns:
+        BosquejoCuantiles: El mismo bosquejo, actualizado.
+        """
+        if isinstance(bloque, pd.DataFrame):
+            bloque = bloque.select_dtypes(include=np.number).to_numpy(dtype=float)
+        bloque = np.asarray(bloque, dtype=float)
+        if bloque.ndim == 1:
+            bloque = bloque[:, np.newaxis]
+        if len(bloque) == 0:
+            return self
+        if not self.niveles:
+            self.niveles.append(np.empty((0, bloque.shape[1])))
+        self.niveles[0] = np.concatenate([self.niveles[0], bloque])
+        self.n += len(bloque)
+        self.compactar()
+        return self
+
+    def combinar(self, otro):
+        """
+        Combina en este bosquejo el de otra partición de los datos.
+
+        Args:
+        otro (BosquejoCuantiles): Bosquejo con las mismas columnas.
+
+        Returns:
+        BosquejoCuantiles: El mismo bosquejo, actualizado.
+        """
+        for nivel, elementos in enumerate(otro.niveles):
+            if nivel < len(self.niveles):
+                self.niveles[nivel] = np.concatenate([self.niveles[nivel], elementos])
+            else:
+                self.niveles.append(elementos.copy())
+        self.n += otro.n
+        self.compactar()
+        return self
+
+    def compactar(self):
+        """
+        Compacta los niveles que superan su capacidad, de abajo hacia arriba.
+        """
+        nivel = 0
+        while nivel < len(self.niveles):
+            elementos = self.niveles[nivel]
+            if len(elementos) > self.capacidad(nivel):
+                if nivel + 1 == len(self.niveles):
+                    self.niveles.append(np.empty((0, elementos.shape[1])))
+                elementos = np.sort(elementos, axis=0)
+                par = len(elementos) - len(elementos) % 2
+                desfasaje = self.generador.integers(2)
+                self.niveles[nivel + 1] = np.concatenate([self.niveles[nivel + 1], elementos[desfasaje:par:2]])
+                self.niveles[nivel] = elementos[par:]
+            nivel += 1
+
+    def cuantiles(self, q):
+        """
+        Estima los cuantiles q de cada columna.
+
+        Args:
+        q (array-like): Cuantiles a estimar, entre 0 y 1.
+
+        Returns:
+        numpy.ndarray: Arreglo de forma (len(q), columnas) con los cuantiles estimados (NaN para las
+        columnas sin valores).
+        """
+        if self.n == 0:
+            raise Exception("El bosquejo no recibió datos.")
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        elementos = np.concatenate(self.niveles)
+        pesos = np.concatenate([np.full(len(e), 2.0 ** nivel) for nivel, e in enumerate(self.niveles)])
+        orden = np.argsort(elementos, axis=0)
+        ordenados = np.take_along_axis(elementos, orden, axis=0)
+        acumulados = np.cumsum(np.where(np.isnan(ordenados), 0.0, pesos[orden]), axis=0)
+        resultado = np.full((len(q), elementos.shape[1]), np.nan)
+        for j in range(elementos.shape[1]):
+            if acumulados[-1, j] == 0:
+                continue
+            posiciones = np.searchsorted(acumulados[:, j], q * acumulados[-1, j], side='left')
+            resultado[:, j] = ordenados[np.minimum(posiciones, len(ordenados) - 1), j]
+        return resultado
+
+class Histograma:
+    """
+    Una clase para guardar un histograma ya binneado y reutilizarlo en nuevas consultas.
+
+    Atributos:
+    intervalos (numpy.ndarray): Bordes de los intervalos, generados con np.arange(minimo, maximo + h, h).
+    f_abs (numpy.ndarray): Frecuencias absolutas de cada intervalo [intervalos[j], intervalos[j + 1]).
+    h (float): El ancho de los intervalos.
+    n (int): Cantidad total de datos (incluidos los que quedan fuera de la grilla).
+    """
+
+    def __init__(self, intervalos, f_abs, h, n):
+        """
+        Inicializa la clase Histograma con los bordes, las frecuencias y el ancho de los intervalos.
+
+        Args:
+        intervalos (numpy.ndarray): Bordes de los intervalos.
+        f_abs (numpy.ndarray): Frecuencias absolutas de cada intervalo.
+        h (float): El ancho de los intervalos.
+        n (int): Cantidad total de datos.
+        """
+        self.intervalos = intervalos
+        self.f_abs = f_abs
+        self.h = h
+        self.n = n
+        self.estim_hist = f_abs / n / h
+
+    def evaluar(self, x):
+        """
+        Devuelve la estimación del histograma en los puntos x sin volver a binnear los datos.
+
+        Args:
+        x (numpy.ndarray): Puntos en los que se evaluará el histograma.
+
+        Returns:
+        numpy.ndarray: Estimaciones del histograma en los puntos x (0 fuera de la grilla).
+        """
+        x = np.asarray(x, dtype=float)
+        indices = np.floor((x - self.intervalos[0]) / self.h)
+        dentro = (indices >= 0) & (indices < len(self.estim_hist))
+        estimaciones = np.zeros(x.shape)
+        estimaciones[dentro] = self.estim_hist[indices[dentro].astype(np.intp)]
+        return estimaciones
+
 class ResumenGrafico:
     """
     Una clase para generar y evaluar gráficos estadísticos y estimaciones de densidad.
@@ -123,11 +759,19 @@ class ResumenGrafico:
         """
         Inicializa la clase ResumenGrafico con un conjunto de datos y puntos x.
 
+        Los np.memmap (por ejemplo, un .npy abierto con mmap_mode) se guardan sin copiar. Las rutas a
+        archivos .npy o .parquet y las tablas de Arrow se abren como FuenteDatos y se leen por bloques.
+
         Args:
-        datos (numpy.ndarray, opcional): Un arreglo numpy que contiene los datos.
+        datos (numpy.ndarray, str o FuenteDatos, opcional): Los datos, o una fuente de una sola columna.
         x (numpy.ndarray, opcional): Puntos en los que se evaluará la densidad o histograma.
         """
-        if datos is not None:
+        if isinstance(datos, np.memmap):
+            self.datos = datos
+        elif FuenteDatos.es_fuente(datos):
+            self.fuente = datos if isinstance(datos, FuenteDatos) else FuenteDatos(datos)
+            self.datos = self.fuente.arreglo
+        elif datos is not None:
             self.datos = np.array(datos)
         self.x = x
 
@@ -143,27 +787,74 @@ class ResumenGrafico:
         list: Estimaciones del histograma en los puntos x.
         """
         self.x = x
-        minimo = min(self.x)
-        maximo = max(self.x)
-        intervalos = np.arange(minimo, maximo + h, h)  # Se ajusta el último valor del rango para incluir el máximo
-        f_abs = np.zeros(len(intervalos) - 1)
-        for dato in self.datos:
-            for j in range(len(intervalos) - 1):
-                if dato >= intervalos[j] and dato < intervalos[j + 1]:
-                    f_abs[j] += 1
-                    break  # Salir del bucle interno una vez que se encuentra el intervalo adecuado
-        f_rel = f_abs / len(self.datos)
-        estim_hist = f_rel / h
-        estimaciones = []
-        for punto in x:
-            # Encontrar el índice del intervalo correspondiente en la grilla
-            indice = int((punto - minimo) / h)
-            if indice >= 0 and indice < len(estim_hist):
-                # Agregar la estimación del histograma para este punto en la grilla
-                estimaciones.append(estim_hist[indice])
+        histograma = self.histograma(h, np.min(x), np.max(x))
+        return histograma.evaluar(x).tolist()
+
+    def datos_ordenados(self):
+        """
+        Devuelve los datos ordenados, ordenándolos una única vez y reutilizando el resultado.
+
+        Returns:
+        numpy.ndarray: Los datos ordenados de menor a mayor.
+        """
+        if getattr(self, '_datos_fuente', None) is not self.datos:
+            self._datos_fuente = self.datos
+            self._datos_ordenados = np.sort(np.asarray(self.datos, dtype=float).ravel())
+        return self._datos_ordenados
+
+    def histogramas_guardados(self):
+        """
+        Devuelve el diccionario de histogramas ya calculados, vaciándolo si cambiaron los datos.
+
+        Returns:
+        dict: Histogramas indexados por (h, minimo, maximo).
+        """
+        origen = (id(self.datos), id(getattr(self, 'fuente', None)))
+        if getattr(self, '_origen_histogramas', None) != origen:
+            self._origen_histogramas = origen
+            self._histogramas = {}
+        return self._histogramas
+
+    def histograma(self, h, minimo, maximo):
+        """
+        Binnea los datos en la grilla np.arange(minimo, maximo + h, h) y guarda el resultado para reutilizarlo.
+
+        Las frecuencias se obtienen con una búsqueda binaria de cada borde sobre los datos ordenados,
+        por lo que cada histograma nuevo cuesta O(intervalos * log n) una vez ordenados los datos.
+        Si los datos vienen de un archivo o de un np.memmap no se ordenan: se recorren por bloques
+        y cada dato se ubica en su intervalo, sin cargar la columna entera en memoria.
+
+        Args:
+        h (float): El ancho de los intervalos del histograma.
+        minimo (float): Primer borde de la grilla.
+        maximo (float): Valor que debe quedar incluido en la grilla.
+
+        Returns:
+        Histograma: Objeto con los bordes y las frecuencias, reutilizable para nuevas consultas.
+        """
+        histogramas = self.histogramas_guardados()
+        clave = (float(h), float(minimo), float(maximo))
+        if clave not in histogramas:
+            intervalos = np.arange(minimo, maximo + h, h)  # Se ajusta el último valor del rango para incluir el máximo
+            fuente = getattr(self, 'fuente', None)
+            if fuente is None and not isinstance(self.datos, np.memmap):
+                datos_ordenados = self.datos_ordenados()
+                # Cantidad de datos menores a cada borde: el intervalo j es [intervalos[j], intervalos[j + 1])
+                acumuladas = np.searchsorted(datos_ordenados, intervalos, side='left')
+                f_abs = np.diff(acumuladas).astype(float)
+                n = len(datos_ordenados)
             else:
-                estimaciones.append(0)  # Si el punto está fuera de los límites, se asume una estimación de 0
-        return estimaciones
+                if fuente is None:
+                    fuente = FuenteDatos(self.datos)
+                f_abs = np.zeros(len(intervalos) - 1)
+                n = 0
+                for bloque in fuente.bloques():
+                    indices = np.searchsorted(intervalos, bloque.ravel(), side='right') - 1
+                    dentro = (indices >= 0) & (indices < len(f_abs))
+                    f_abs += np.bincount(indices[dentro], minlength=len(f_abs))
+                    n += bloque.size
+            histogramas[clave] = Histograma(intervalos, f_abs, h, n)
+        return histogramas[clave]
 
     def kernel_gaussiano(self, x):
         """
@@ -217,103 +908,617 @@ class ResumenGrafico:
         Returns:
         numpy.ndarray: Valores del kernel Triangular en los puntos x.
         """
-        xmas = (1 + x) * ((x > -1) & (x < 0))
+        xmas = (1 + x) * ((x > -1) & (x <= 0))
         xmen = (1 - x) * ((x > 0) & (x < 1))
         valor_kernel_triangular = xmas + xmen
         return valor_kernel_triangular
 
-    def mi_densidad(self, x, data, h, kernel):
+    def kernel_convolucionado(self, x, kernel):
         """
-        Calcula la densidad estimada utilizando un kernel específico.
+        Calcula la convolución del kernel consigo mismo (K * K) en los puntos x.
 
         Args:
-        x (numpy.ndarray): Puntos en los que se evaluará la densidad.
-        data (numpy.ndarray): Datos.
-        h (float): Ancho de la ventana (bandwidth).
-        kernel (str): Tipo de kernel a utilizar ('gaussiano', 'uniforme', 'cuadratico', 'triangular').
+        x (numpy.ndarray): Puntos en los que se evaluará la convolución.
+        kernel (str): Tipo de kernel ('gaussiano', 'uniforme', 'cuadratico', 'triangular').
 
         Returns:
-        list: Densidad estimada en los puntos x.
-        """
-        n = len(data)
-        densidad_estimada = []
-        for valor_x in x:
-            contribuciones_kernel = []
-            for dato in data:
-                if kernel == "gaussiano":
-                    contribuciones_kernel.append(self.kernel_gaussiano((dato - valor_x) / h))
-                elif kernel == "uniforme":
-                    contribuciones_kernel.append(self.kernel_uniforme((dato - valor_x) / h))
-                elif kernel == "cuadratico":
-                    contribuciones_kernel.append(self.kernel_cuadratico((dato - valor_x) / h))
-                elif kernel == "triangular":
-                    contribuciones_kernel.append(self.kernel_triangular((dato - valor_x) / h))
-            suma_contribuciones = np.sum(contribuciones_kernel)
-            densidad_estimada.append(suma_contribuciones / (n * h))
-        return densidad_estimada
-
-    def miqqplot(data):
-        """
-        Genera un gráfico Q-Q (quantile-quantile) para comparar los cuantiles muestrales con los teóricos.
-
-        Args:
-        data (numpy.ndarray): Datos a ser graficados.
+        numpy.ndarray: Valores de K * K en los puntos x.
         """
-        media = np.mean(data)
-        desvio = np.std(data)
-        data_s = (data - media) / desvio
-        cuantiles_muestrales = np.sort(data_s)
-        n = len(data)
-        pp = np.arange(1, (n + 1)) / (n + 1)
-        cuantiles_teoricos = norm.ppf(pp)
-        plt.scatter(cuantiles_teoricos, data_s, color='blue', marker='o')
-        plt.xlabel('Cuantiles teóricos')
-        plt.ylabel('Cuantiles muestrales')
-        plt.plot(cuantiles_teoricos, cuantiles_teoricos, linestyle='-', color='red')
-        plt.show()
+        u = np.abs(x)
+        if kernel == 'gaussiano':
+            return np.exp(-0.25 * u ** 2) / np.sqrt(4 * np.pi)
+        if kernel == 'uniforme':
+            return np.clip(1 - u, 0, None)
+        if kernel == 'cuadratico':
+            return (3 / 160) * np.clip(2 - u, 0, None) ** 3 * (u ** 2 + 6 * u + 4)
+        if kernel == 'triangular':
+            cerca = (2 / 3 - u ** 2 + u ** 3 / 2) * (u <= 1)
+            lejos = np.clip(2 - u, 0, None) ** 3 / 6 * (u > 1)
+            return cerca + lejos
+        raise Exception(f"Kernel desconocido: {kernel}.")
 
-class GeneradoraDeDatos:
-    """
-    Una clase para generar datos a partir de distribuciones normales y no estándar.
+    # Radio (en unidades de h) fuera del cual cada kernel se anula o es despreciable
+    soporte_kernel = {'gaussiano': 5.0, 'uniforme': 0.5, 'cuadratico': 1.0, 'triangular': 1.0}
 
-    Atributos:
-    N (int): El número de datos a generar.
-    """
+    # Ancho canónico (R(K) / mu2(K) ** 2) ** (1 / 5) de cada kernel, para trasladar las reglas gaussianas
+    ancho_canonico = {'gaussiano': (1 / (2 * np.sqrt(np.pi))) ** 0.2, 'uniforme': 144 ** 0.2,
+                      'cuadratico': 15 ** 0.2, 'triangular': 24 ** 0.2}
 
-    def __init__(self, N):
+    def funcion_kernel(self, kernel):
         """
-        Inicializa la clase GeneradoraDeDatos con el número de datos a generar.
+        Devuelve el método que evalúa el kernel indicado.
 
         Args:
-        N (int): El número de datos a generar.
+        kernel (str): Tipo de kernel ('gaussiano', 'uniforme', 'cuadratico', 'triangular').
+
+        Returns:
+        callable: Método del kernel, vectorizado sobre arreglos numpy.
         """
-        self.N = N
+        kernels = {
+            'gaussiano': self.kernel_gaussiano,
+            'uniforme': self.kernel_uniforme,
+            'cuadratico': self.kernel_cuadratico,
+            'triangular': self.kernel_triangular
+        }
+        if kernel not in kernels:
+            raise Exception(f"Kernel desconocido: {kernel}. Opciones: {', '.join(kernels)}.")
+        return kernels[kernel]
 
-    def generar_datos_dist_norm(self, media, desvio):
+    def mi_densidad(self, x, data, h, kernel, metodo='exacto', m_grilla=2 ** 14):
         """
-        Genera datos a partir de una distribución normal.
+        Calcula la densidad estimada utilizando un kernel específico.
+
+        Con metodo='fft' los datos se binnean linealmente en una grilla regular y se convolucionan
+        con el kernel mediante FFT. Para los kernels gaussiano, cuadrático y triangular el error
+        es del orden de (delta / h) ** 2 veces el máximo de la densidad, donde delta es el paso de
+        la grilla (con la grilla por defecto, menor a 1e-4). El kernel uniforme es discontinuo:
+        cerca de cada salto la aproximación puede diferir de la exacta en el aporte de los datos
+        que caen a menos de delta del borde de la ventana, es decir en unos pocos 1 / (n * h).
 
         Args:
-        media (float): La media de la distribución.
-        desvio (float): El desvío estándar de la distribución.
+        x (numpy.ndarray): Puntos en los que se evaluará la densidad.
+        data (numpy.ndarray): Datos.
+        h (float): Ancho de la ventana (bandwidth).
+        kernel (str): Tipo de kernel a utilizar ('gaussiano', 'uniforme', 'cuadratico', 'triangular').
+        metodo (str): 'exacto' (suma directa sobre todos los datos), 'vecinos' (exacto, solo con los datos
+            dentro de la ventana; para kernels de soporte compacto) o 'fft' (aproximación binneada). Por defecto es 'exacto'.
+        m_grilla (int): Cantidad mínima de puntos de la grilla para metodo='fft'. Por defecto es 2 ** 14.
 
         Returns:
-        numpy.ndarray: Datos generados a partir de una distribución normal.
+        list: Densidad estimada en los puntos x.
         """
-        return np.random.normal(loc=media, scale=desvio, size=self.N)
+        if metodo == 'exacto':
+            densidad_estimada = self.densidad_exacta(x, data, h, kernel)
+        elif metodo == 'vecinos':
+            densidad_estimada = self.densidad_vecinos(x, data, h, kernel)
+        elif metodo == 'fft':
+            densidad_estimada = self.densidad_fft(x, data, h, kernel, m_grilla)
+        else:
+            raise Exception(f"Método desconocido: {metodo}. Opciones: exacto, vecinos, fft.")
+        return densidad_estimada.tolist()
 
-    def pdf_norm(self, x, media, desvio):
+    def densidad_exacta(self, x, data, h, kernel, tam_bloque=2 ** 22):
         """
-        Calcula la función de densidad de probabilidad (PDF) de una distribución normal.
+        Calcula la densidad estimada sumando el kernel sobre todos los datos, por bloques de puntos x.
 
         Args:
-        x (numpy.ndarray): Puntos en los que se evaluará la PDF.
-        media (float): La media de la distribución.
+        x (numpy.ndarray): Puntos en los que se evaluará la densidad.
+        data (numpy.ndarray): Datos.
+        h (float): Ancho de la ventana (bandwidth).
+        kernel (str): Tipo de kernel a utilizar.
+        tam_bloque (int): Cantidad máxima de evaluaciones del kernel por bloque. Por defecto es 2 ** 22.
+
+        Returns:
+        numpy.ndarray: Densidad estimada en los puntos x.
+        """
+        funcion = self.funcion_kernel(kernel)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        data = np.asarray(data, dtype=float).ravel()
+        n = len(data)
+        densidad_estimada = np.zeros(len(x))
+        paso = max(1, tam_bloque // max(n, 1))
+        for inicio in range(0, len(x), paso):
+            valores_x = x[inicio:inicio + paso]
+            contribuciones_kernel = funcion((data[np.newaxis, :] - valores_x[:, np.newaxis]) / h)
+            densidad_estimada[inicio:inicio + paso] = np.sum(contribuciones_kernel, axis=1) / (n * h)
+        return densidad_estimada
+
+    def densidad_vecinos(self, x, data, h, kernel, tam_bloque=2 ** 22):
+        """
+        Calcula la densidad estimada exacta evaluando, para cada punto x, solo los datos dentro de su ventana.
+
+        Los datos se ordenan una vez y las ventanas [x - r * h, x + r * h] se ubican con búsquedas
+        binarias, por lo que el costo es O((n + m) log n + evaluaciones dentro de las ventanas).
+        Solo tiene sentido para kernels de soporte compacto; con el gaussiano se usa la suma completa.
+
+        Args:
+        x (numpy.ndarray): Puntos en los que se evaluará la densidad.
+        data (numpy.ndarray): Datos.
+        h (float): Ancho de la ventana (bandwidth).
+        kernel (str): Tipo de kernel a utilizar ('uniforme', 'cuadratico', 'triangular').
+        tam_bloque (int): Cantidad máxima de evaluaciones del kernel por bloque. Por defecto es 2 ** 22.
+
+        Returns:
+        numpy.ndarray: Densidad estimada en los puntos x.
+        """
+        funcion = self.funcion_kernel(kernel)
+        if kernel == 'gaussiano':
+            return self.densidad_exacta(x, data, h, kernel, tam_bloque)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        datos_ordenados = np.sort(np.asarray(data, dtype=float).ravel())
+        n = len(datos_ordenados)
+        radio = self.soporte_kernel[kernel] * h
+        desde = np.searchsorted(datos_ordenados, x - radio, side='left')
+        hasta = np.searchsorted(datos_ordenados, x + radio, side='right')
+        vecinos = hasta - desde
+        acumulados = np.cumsum(vecinos)
+
+        densidad_estimada = np.zeros(len(x))
+        inicio = 0
+        while inicio < len(x):
+            # Se toman puntos x hasta juntar tam_bloque evaluaciones (al menos un punto por bloque)
+            base = acumulados[inicio - 1] if inicio > 0 else 0
+            fin = max(inicio + 1, int(np.searchsorted(acumulados, base + tam_bloque, side='right')))
+            cantidades = vecinos[inicio:fin]
+            total = int(cantidades.sum())
+            if total > 0:
+                puntos = np.repeat(np.arange(fin - inicio), cantidades)
+                desplazamiento = np.arange(total) - np.repeat(np.cumsum(cantidades) - cantidades, cantidades)
+                indices = desde[inicio:fin][puntos] + desplazamiento
+                contribuciones_kernel = funcion((datos_ordenados[indices] - x[inicio:fin][puntos]) / h)
+                densidad_estimada[inicio:fin] = np.bincount(puntos, weights=contribuciones_kernel,
+                                                            minlength=fin - inicio) / (n * h)
+            inicio = fin
+        return densidad_estimada
+
+    def densidad_fft(self, x, data, h, kernel, m_grilla=2 ** 14):
+        """
+        Aproxima la densidad estimada binneando los datos en una grilla y convolucionando con el kernel vía FFT.
+
+        Args:
+        x (numpy.ndarray): Puntos en los que se evaluará la densidad.
+        data (numpy.ndarray): Datos.
+        h (float): Ancho de la ventana (bandwidth).
+        kernel (str): Tipo de kernel a utilizar.
+        m_grilla (int): Cantidad mínima de puntos de la grilla. Por defecto es 2 ** 14.
+
+        Returns:
+        numpy.ndarray: Densidad estimada en los puntos x.
+        """
+        funcion = self.funcion_kernel(kernel)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        data = np.asarray(data, dtype=float).ravel()
+        n = len(data)
+        a = min(np.min(data), np.min(x))
+        b = max(np.max(data), np.max(x))
+        # Al menos 20 puntos de grilla por ventana, con un tope para acotar la memoria
+        m = int(min(max(m_grilla, np.ceil(20 * (b - a) / h) + 1), 2 ** 22))
+        delta = (b - a) / (m - 1) if b > a else h / 20
+
+        # Binning lineal: cada dato reparte su peso entre los dos nodos vecinos
+        posicion = (data - a) / delta
+        izquierda = np.clip(np.floor(posicion).astype(np.intp), 0, m - 2)
+        peso_derecha = posicion - izquierda
+        conteos = np.bincount(izquierda, weights=1 - peso_derecha, minlength=m)
+        conteos += np.bincount(izquierda + 1, weights=peso_derecha, minlength=m)
+
+        # Kernel promediado en cada celda de la grilla (así los saltos de los kernels
+        # de soporte compacto no dependen de dónde caen los nodos), truncado a su soporte
+        radio = int(min(m - 1, np.ceil(self.soporte_kernel[kernel] * h / delta)) + 1)
+        subceldas = (np.arange(8) + 0.5) / 8 - 0.5
+        desplazamientos = (np.arange(-radio, radio + 1)[:, np.newaxis] + subceldas) * delta
+        pesos_kernel = funcion(desplazamientos / h).astype(float).mean(axis=1)
+
+        largo = m + 2 * radio
+        largo_fft = 1 << int(np.ceil(np.log2(largo)))
+        convolucion = np.fft.irfft(np.fft.rfft(conteos, largo_fft) * np.fft.rfft(pesos_kernel, largo_fft), largo_fft)
+        densidad_grilla = convolucion[radio:radio + m] / (n * h)
+        grilla = a + np.arange(m) * delta
+        return np.interp(x, grilla, densidad_grilla, left=0.0, right=0.0)
+
+    def seleccionar_ventana(self, data=None, metodo='silverman', kernel='gaussiano', hs=None,
+                            binneado=None, m_grilla=2 ** 14):
+        """
+        Selecciona el ancho de ventana h para mi_densidad o evaluacion_histograma.
+
+        Las reglas 'silverman' y 'scott' son fórmulas cerradas. Las validaciones cruzadas
+        'cv_minimos_cuadrados' y 'cv_verosimilitud' evalúan cada h de hs reutilizando las
+        distancias entre pares de datos, que se calculan una sola vez por conjunto de datos
+        (exactas para muestras chicas, binneadas en una grilla para muestras grandes) y se
+        comparten entre candidatos y kernels. Los puntajes quedan en self.puntajes_cv.
+
+        Args:
+        data (numpy.ndarray, opcional): Datos. Por defecto se usan self.datos. Con una fuente Parquet
+            o Arrow, que no tiene un arreglo en memoria, los datos se deben pasar explícitamente.
+        metodo (str): 'silverman', 'scott', 'cv_minimos_cuadrados' o 'cv_verosimilitud'. Por defecto es 'silverman'.
+        kernel (str): Kernel de mi_densidad o 'histograma'. Por defecto es 'gaussiano'.
+        hs (numpy.ndarray, opcional): Candidatos para la validación cruzada. Por defecto, 30 valores
+            geométricamente espaciados entre 0.1 y 2 veces la regla de Silverman.
+        binneado (bool, opcional): Si se binnean las distancias. Por defecto se binnean cuando n > 2000.
+        m_grilla (int): Puntos de la grilla usada al binnear. Por defecto es 2 ** 14.
+
+        Returns:
+        float: El ancho de ventana seleccionado.
+        """
+        if data is None:
+            if self.datos is None:
+                raise Exception("La fuente de datos no tiene un arreglo en memoria; pase los datos con el argumento data.")
+            data = self.datos
+        data = np.asarray(data, dtype=float).ravel()
+        n = len(data)
+        desvio = np.std(data, ddof=1)
+        q1, q3 = np.percentile(data, [25, 75])
+        escala = min(desvio, (q3 - q1) / 1.349) if q3 > q1 else desvio
+
+        if kernel == 'histograma':
+            reglas = {'silverman': 3.49 * escala * n ** (-1 / 3), 'scott': 3.49 * desvio * n ** (-1 / 3)}
+        else:
+            self.funcion_kernel(kernel)
+            factor = self.ancho_canonico[kernel] / self.ancho_canonico['gaussiano']
+            reglas = {'silverman': 0.9 * escala * n ** (-0.2) * factor, 'scott': 1.06 * desvio * n ** (-0.2) * factor}
+        if metodo in reglas:
+            return reglas[metodo]
+
+        if metodo not in ('cv_minimos_cuadrados', 'cv_verosimilitud'):
+            raise Exception(f"Método desconocido: {metodo}. Opciones: silverman, scott, cv_minimos_cuadrados, cv_verosimilitud.")
+        if hs is None:
+            hs = reglas['silverman'] * np.geomspace(0.1, 2, 30)
+        hs = np.asarray(hs, dtype=float)
+
+        if kernel == 'histograma':
+            if metodo == 'cv_verosimilitud':
+                raise Exception("La validación cruzada por verosimilitud no está disponible para el histograma.")
+            datos_ordenados = np.sort(data)
+            puntajes = np.empty(len(hs))
+            for i, h in enumerate(hs):
+                intervalos = np.arange(datos_ordenados[0], datos_ordenados[-1] + h, h)
+                p = np.diff(np.searchsorted(datos_ordenados, intervalos, side='left')) / n
+                puntajes[i] = 2 / ((n - 1) * h) - (n + 1) / ((n - 1) * h) * np.sum(p ** 2)
+        else:
+            if binneado is None:
+                binneado = n > 2000
+            pares = self.pares_de_datos(data, binneado, m_grilla)
+            funcion = self.funcion_kernel(kernel)
+            puntajes = np.empty(len(hs))
+            for i, h in enumerate(hs):
+                if metodo == 'cv_minimos_cuadrados':
+                    puntajes[i] = self.puntaje_cv_minimos_cuadrados(pares, n, h, kernel)
+                else:
+                    puntajes[i] = -self.puntaje_cv_verosimilitud(pares, n, h, funcion)
+
+        self.puntajes_cv = {'h': hs, 'puntaje': puntajes}
+        return hs[np.nanargmin(puntajes)]
+
+    def pares_de_datos(self, data, binneado, m_grilla):
+        """
+        Devuelve las distancias entre pares de datos, calculándolas una vez por conjunto de datos.
+
+        Sin binnear se guardan las distancias |x_i - x_j| de cada par i < j. Al binnear, los datos
+        se asignan al nodo más cercano de una grilla regular y se guardan los conteos por nodo y la
+        cantidad de pares ordenados a cada distancia (múltiplo del paso), obtenida por FFT.
+
+        Args:
+        data (numpy.ndarray): Datos.
+        binneado (bool): Si se binnean las distancias.
+        m_grilla (int): Puntos de la grilla usada al binnear.
+
+        Returns:
+        dict: Distancias y pesos (pares ordenados con i != j) y, según el caso, los índices de cada par o los conteos por nodo.
+        """
+        cache = getattr(self, '_pares_cv', None)
+        clave = (binneado, m_grilla)
+        if cache is not None and cache['clave'] == clave and np.array_equal(cache['data'], data):
+            return cache['pares']
+        n = len(data)
+        if not binneado:
+            i, j = np.triu_indices(n, k=1)
+            pares = {'distancias': np.abs(data[i] - data[j]), 'pesos': np.full(len(i), 2.0), 'i': i, 'j': j}
+        else:
+            a, b = np.min(data), np.max(data)
+            delta = (b - a) / (m_grilla - 1) if b > a else 1.0
+            nodos = np.rint((data - a) / delta).astype(np.intp)
+            conteos = np.bincount(nodos, minlength=m_grilla).astype(float)
+            largo_fft = 1 << int(np.ceil(np.log2(2 * m_grilla)))
+            transformada = np.fft.rfft(conteos, largo_fft)
+            por_distancia = np.rint(np.fft.irfft(transformada * np.conj(transformada), largo_fft)[:m_grilla])
+            # Pares ordenados: la distancia 0 ya cuenta ambos órdenes; se descuentan los n pares (i, i)
+            pesos = 2 * por_distancia
+            pesos[0] = por_distancia[0] - n
+            pares = {'distancias': np.arange(m_grilla) * delta, 'pesos': pesos, 'conteos': conteos, 'delta': delta}
+        self._pares_cv = {'clave': clave, 'data': data, 'pares': pares}
+        return pares
+
+    def puntaje_cv_minimos_cuadrados(self, pares, n, h, kernel):
+        """
+        Calcula el criterio de validación cruzada por mínimos cuadrados para un ancho h.
+
+        Args:
+        pares (dict): Distancias entre pares devueltas por pares_de_datos.
+        n (int): Cantidad de datos.
+        h (float): Ancho de ventana.
+        kernel (str): Tipo de kernel.
+
+        Returns:
+        float: Estimación de la integral del error cuadrático (salvo una constante); menor es mejor.
+        """
+        u = pares['distancias'] / h
+        integral_cuadrado = (n * self.kernel_convolucionado(0.0, kernel)
+                             + np.dot(pares['pesos'], self.kernel_convolucionado(u, kernel))) / (n ** 2 * h)
+        dejando_uno_fuera = np.dot(pares['pesos'], self.funcion_kernel(kernel)(u)) / (n * (n - 1) * h)
+        return integral_cuadrado - 2 * dejando_uno_fuera
+
+    def puntaje_cv_verosimilitud(self, pares, n, h, funcion):
+        """
+        Calcula la log-verosimilitud media dejando uno fuera para un ancho h.
+
+        Args:
+        pares (dict): Distancias entre pares devueltas por pares_de_datos.
+        n (int): Cantidad de datos.
+        h (float): Ancho de ventana.
+        funcion (callable): Método del kernel.
+
+        Returns:
+        float: Log-verosimilitud media; mayor es mejor.
+        """
+        with np.errstate(divide='ignore'):
+            if 'i' in pares:
+                valores = funcion(pares['distancias'] / h)
+                sumas = np.bincount(pares['i'], weights=valores, minlength=n) + np.bincount(pares['j'], weights=valores, minlength=n)
+                return np.mean(np.log(sumas / ((n - 1) * h)))
+            conteos = pares['conteos']
+            m = len(conteos)
+            radio = int(min(m - 1, np.ceil(5 * h / pares['delta'])))
+            pesos_kernel = funcion(np.arange(-radio, radio + 1) * pares['delta'] / h).astype(float)
+            largo_fft = 1 << int(np.ceil(np.log2(m + 2 * radio)))
+            convolucion = np.fft.irfft(np.fft.rfft(conteos, largo_fft) * np.fft.rfft(pesos_kernel, largo_fft), largo_fft)
+            sumas = np.clip(convolucion[radio:radio + m] - funcion(np.zeros(1))[0], 0, None)
+            ocupados = conteos > 0
+            return np.sum(conteos[ocupados] * np.log(sumas[ocupados] / ((n - 1) * h))) / n
+
+    @staticmethod
+    def miqqplot(data, archivo=None, max_puntos=5000, titulo=None):
+        """
+        Genera un gráfico Q-Q (quantile-quantile) para comparar los cuantiles muestrales con los teóricos.
+
+        Con más de max_puntos datos no se grafican todos los cuantiles: se eligen max_puntos
+        estadísticos de orden equiespaciados en rango (incluidos el mínimo y el máximo), que se
+        obtienen con np.partition sin ordenar la muestra completa.
+
+        Args:
+        data (numpy.ndarray): Datos a ser graficados.
+        archivo (str, opcional): Ruta del archivo de imagen. Si se indica, el gráfico se guarda sin mostrarse.
+        max_puntos (int, opcional): Cantidad máxima de puntos a graficar. None grafica todos.
+        titulo (str, opcional): Título del gráfico.
+        """
+        from scipy.stats import norm
+        data = np.asarray(data, dtype=float)
+        n = len(data)
+        data_s = (data - np.mean(data)) / np.std(data)
+        if max_puntos is None or n <= max_puntos:
+            rangos = np.arange(n)
+            cuantiles_muestrales = np.sort(data_s)
+        else:
+            rangos = np.unique(np.linspace(0, n - 1, max_puntos).round().astype(int))
+            cuantiles_muestrales = np.partition(data_s, rangos)[rangos]
+        cuantiles_teoricos = norm.ppf((rangos + 1) / (n + 1))
+        figura, ejes = ResumenGrafico.nueva_figura(archivo)
+        ejes.scatter(cuantiles_teoricos, cuantiles_muestrales, color='blue', marker='o', rasterized=True)
+        ejes.set_xlabel('Cuantiles teóricos')
+        ejes.set_ylabel('Cuantiles muestrales')
+        ejes.plot(cuantiles_teoricos[[0, -1]], cuantiles_teoricos[[0, -1]], linestyle='-', color='red')
+        if titulo is not None:
+            ejes.set_title(titulo)
+        ResumenGrafico.cerrar_figura(figura, archivo)
+
+    @staticmethod
+    def nueva_figura(archivo=None, figsize=(10, 6)):
+        """
+        Crea una figura con un único par de ejes.
+
+        Si se va a guardar en un archivo, la figura se crea sin pyplot, de modo que se dibuja con el
+        backend no interactivo (Agg) aunque no haya pantalla.
+
+        Args:
+        archivo (str, opcional): Ruta del archivo de imagen, o None para mostrar la figura.
+        figsize (tuple): Tamaño de la figura. Por defecto es (10, 6).
+
+        Returns:
+        tuple: La figura y sus ejes.
+        """
+        if archivo is None:
+            import matplotlib.pyplot as plt
+            figura, ejes = plt.subplots(figsize=figsize)
+        else:
+            from matplotlib.figure import Figure
+            figura = Figure(figsize=figsize)
+            ejes = figura.subplots()
+        return figura, ejes
+
+    @staticmethod
+    def cerrar_figura(figura, archivo=None):
+        """
+        Muestra la figura o la guarda en un archivo.
+
+        Args:
+        figura (matplotlib.figure.Figure): Figura creada con nueva_figura.
+        archivo (str, opcional): Ruta del archivo de imagen, o None para mostrar la figura.
+        """
+        if archivo is None:
+            import matplotlib.pyplot as plt
+            plt.show()
+        else:
+            figura.savefig(archivo)
+
+    @staticmethod
+    def ruta_con_sufijo(archivo, sufijo):
+        """
+        Agrega un sufijo al nombre de un archivo antes de su extensión (None si no hay archivo).
+
+        Args:
+        archivo (str): Ruta del archivo.
+        sufijo (str): Sufijo a agregar.
+
+        Returns:
+        str: La ruta con el sufijo.
+        """
+        if archivo is None:
+            return None
+        base, extension = os.path.splitext(os.fspath(archivo))
+        return f'{base}_{sufijo}{extension}'
+
+    @staticmethod
+    def dispersion(ejes, x, y, max_puntos=5000, **kwargs):
+        """
+        Grafica un diagrama de dispersión cuyo costo de dibujo no depende de n.
+
+        Hasta max_puntos puntos se grafica un scatter rasterizado; con más, los puntos se agrupan
+        en celdas hexagonales (hexbin) coloreadas según la cantidad de puntos de cada una.
+
+        Args:
+        ejes (matplotlib.axes.Axes): Ejes donde graficar.
+        x (array-like): Coordenadas horizontales.
+        y (array-like): Coordenadas verticales.
+        max_puntos (int, opcional): Cantidad máxima de puntos a graficar individualmente. None grafica todos.
+        **kwargs: Argumentos adicionales para scatter o hexbin (por ejemplo, label).
+        """
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if max_puntos is None or len(x) <= max_puntos:
+            ejes.scatter(x, y, rasterized=True, **kwargs)
+        else:
+            ejes.hexbin(x, y, gridsize=100, mincnt=1, bins='log', cmap='Blues', **kwargs)
+
+class MezclaGaussiana:
+    """
+    Una clase para muestrear y evaluar mezclas de distribuciones normales.
+
+    Atributos:
+    pesos (numpy.ndarray): Pesos de cada componente (suman 1).
+    medias (numpy.ndarray): Medias de cada componente.
+    desvios (numpy.ndarray): Desvíos estándar de cada componente.
+    """
+
+    def __init__(self, pesos, medias, desvios):
+        """
+        Inicializa la mezcla con los pesos, medias y desvíos de sus componentes.
+
+        Args:
+        pesos (array-like): Pesos de cada componente; se normalizan para que sumen 1.
+        medias (array-like): Medias de cada componente.
+        desvios (array-like): Desvíos estándar de cada componente.
+        """
+        self.pesos = np.asarray(pesos, dtype=float) / np.sum(pesos)
+        self.medias = np.asarray(medias, dtype=float)
+        self.desvios = np.asarray(desvios, dtype=float)
+        self.pesos_acumulados = np.cumsum(self.pesos)
+
+    @staticmethod
+    def bart_simpson(media=0, desvio=1):
+        """
+        Devuelve la mezcla "bart simpson": la mitad N(media, desvio) y cinco picos N(j/2 - 1, 1/10) de peso 1/10.
+
+        Args:
+        media (float): La media de la componente principal. Por defecto es 0.
+        desvio (float): El desvío estándar de la componente principal. Por defecto es 1.
+
+        Returns:
+        MezclaGaussiana: La mezcla.
+        """
+        return MezclaGaussiana([0.5] + [0.1] * 5,
+                               [media] + [j / 2 - 1 for j in range(5)],
+                               [desvio] + [1 / 10] * 5)
+
+    def muestrear(self, N, generador=None, salida=None, tam_bloque=2 ** 20):
+        """
+        Genera N datos de la mezcla.
+
+        Por cada bloque se sortea la componente de cada dato (una única extracción categórica) y
+        las normales estándar se escriben directamente en el arreglo de salida, que luego se
+        escala y desplaza en el lugar. La memoria extra está acotada por el tamaño del bloque.
+
+        Args:
+        N (int): Cantidad de datos a generar.
+        generador (numpy.random.Generator, opcional): Generador aleatorio. Por defecto se crea uno nuevo.
+        salida (numpy.ndarray, opcional): Arreglo float64 de largo N donde escribir (por ejemplo un np.memmap).
+        tam_bloque (int): Cantidad de datos por bloque. Por defecto es 2 ** 20.
+
+        Returns:
+        numpy.ndarray: Los datos generados.
+        """
+        if generador is None:
+            generador = np.random.default_rng()
+        if salida is None:
+            salida = np.empty(N)
+        for inicio in range(0, N, tam_bloque):
+            bloque = salida[inicio:inicio + tam_bloque]
+            componentes = np.searchsorted(self.pesos_acumulados, generador.random(len(bloque)), side='right')
+            np.minimum(componentes, len(self.pesos) - 1, out=componentes)
+            generador.standard_normal(out=bloque)
+            bloque *= self.desvios[componentes]
+            bloque += self.medias[componentes]
+        return salida
+
+    def densidad(self, x):
+        """
+        Calcula la densidad de la mezcla en los puntos x, en un único cálculo vectorizado sobre todas las componentes.
+
+        Args:
+        x (numpy.ndarray): Puntos en los que se evaluará la densidad.
+
+        Returns:
+        numpy.ndarray: Valores de la densidad en los puntos x.
+        """
+        x = np.asarray(x, dtype=float)
+        z = (x[..., np.newaxis] - self.medias) / self.desvios
+        return np.exp(-0.5 * z ** 2) @ (self.pesos / (self.desvios * np.sqrt(2 * np.pi)))
+
+class GeneradoraDeDatos:
+    """
+    Una clase para generar datos a partir de distribuciones normales y no estándar.
+
+    Atributos:
+    N (int): El número de datos a generar.
+    semilla (numpy.random.SeedSequence): Semilla de la que se derivan todos los flujos aleatorios.
+    generador (numpy.random.Generator): Generador aleatorio propio (no usa el estado global de np.random).
+    """
+
+    def __init__(self, N, seed=None):
+        """
+        Inicializa la clase GeneradoraDeDatos con el número de datos a generar.
+
+        Args:
+        N (int): El número de datos a generar.
+        seed (int o numpy.random.SeedSequence, opcional): Semilla para resultados reproducibles.
+        """
+        self.N = N
+        self.semilla = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.generador = np.random.default_rng(self.semilla.spawn(1)[0])
+
+    def generar_datos_dist_norm(self, media, desvio):
+        """
+        Genera datos a partir de una distribución normal.
+
+        Args:
+        media (float): La media de la distribución.
+        desvio (float): El desvío estándar de la distribución.
+
+        Returns:
+        numpy.ndarray: Datos generados a partir de una distribución normal.
+        """
+        return self.generador.normal(loc=media, scale=desvio, size=self.N)
+
+    def pdf_norm(self, x, media, desvio):
+        """
+        Calcula la función de densidad de probabilidad (PDF) de una distribución normal.
+
+        Args:
+        x (numpy.ndarray): Puntos en los que se evaluará la PDF.
+        media (float): La media de la distribución.
         desvio (float): El desvío estándar de la distribución.
 
         Returns:
         numpy.ndarray: Valores de la PDF en los puntos x.
         """
+        from scipy.stats import norm
         return norm.pdf(x, media, desvio)
 
     def r_BS(self):
@@ -323,16 +1528,69 @@ class GeneradoraDeDatos:
         Returns:
         numpy.ndarray: Datos generados a partir de una distribución no estándar.
         """
-        u = np.random.uniform(size=(self.N,))
-        y = u.copy()
-        ind = np.where(u > 0.5)[0]
-        y[ind] = np.random.normal(0, 1, size=len(ind))
-        for j in range(5):
-            ind = np.where((u > j * 0.1) & (u <= (j + 1) * 0.1))[0]
-            y[ind] = np.random.normal(j/2 - 1, 1/10, size=len(ind))
-            self.y = y
+        y = MezclaGaussiana.bart_simpson().muestrear(self.N, self.generador)
+        self.y = y
         return y
 
+    def r_mezcla(self, mezcla, salida=None):
+        """
+        Genera datos a partir de una mezcla de normales.
+
+        Args:
+        mezcla (MezclaGaussiana): La mezcla a muestrear.
+        salida (numpy.ndarray, opcional): Arreglo de largo N donde escribir los datos (por ejemplo un np.memmap).
+
+        Returns:
+        numpy.ndarray: Datos generados a partir de la mezcla.
+        """
+        return mezcla.muestrear(self.N, self.generador, salida)
+
+    def generar_en_paralelo(self, distribucion, trabajadores=None, archivo=None, tam_bloque=2 ** 22, media=0, desvio=1):
+        """
+        Genera N datos en paralelo, llenando por bloques un arreglo preasignado.
+
+        Cada bloque de tam_bloque datos tiene su propio flujo aleatorio, derivado de la semilla con
+        SeedSequence.spawn, y lo llena un hilo (NumPy libera el GIL al generar). Como los flujos
+        dependen del bloque y no del hilo, el resultado es idéntico bit a bit para cualquier
+        cantidad de trabajadores, dada la misma semilla.
+
+        Args:
+        distribucion (str o MezclaGaussiana): 'normal' o una mezcla de normales.
+        trabajadores (int, opcional): Cantidad de hilos. Por defecto, la cantidad de núcleos.
+        archivo (str, opcional): Ruta a un archivo .npy donde generar los datos (mapeado en memoria).
+        tam_bloque (int): Cantidad de datos por bloque. Por defecto es 2 ** 22.
+        media (float): La media, si distribucion es 'normal'. Por defecto es 0.
+        desvio (float): El desvío estándar, si distribucion es 'normal'. Por defecto es 1.
+
+        Returns:
+        numpy.ndarray: Los datos generados (un np.memmap si se indicó archivo).
+        """
+        if archivo is None:
+            salida = np.empty(self.N)
+        else:
+            salida = np.lib.format.open_memmap(archivo, mode='w+', dtype=np.float64, shape=(self.N,))
+        inicios = range(0, self.N, tam_bloque)
+        semillas = self.semilla.spawn(len(inicios))
+
+        def llenar(tarea):
+            inicio, semilla = tarea
+            generador = np.random.default_rng(semilla)
+            bloque = salida[inicio:inicio + tam_bloque]
+            if isinstance(distribucion, MezclaGaussiana):
+                distribucion.muestrear(len(bloque), generador, bloque)
+            elif distribucion == 'normal':
+                generador.standard_normal(out=bloque)
+                bloque *= desvio
+                bloque += media
+            else:
+                raise Exception(f"Distribución desconocida: {distribucion}. Opciones: normal o una MezclaGaussiana.")
+
+        with ThreadPoolExecutor(trabajadores or os.cpu_count()) as pool:
+            list(pool.map(llenar, zip(inicios, semillas)))
+        if archivo is not None:
+            salida.flush()
+        return salida
+
     def teorica_BS(self, x, media, desvio):
         """
         Calcula la función de densidad de probabilidad (PDF) teórica para una distribución no estándar.
@@ -345,16 +1603,397 @@ class GeneradoraDeDatos:
         Returns:
         numpy.ndarray: Valores de la PDF teórica en los puntos x.
         """
-        contribucion_estandar = norm.pdf(x, loc=media, scale=desvio) / 2  # Término 1: densidad de una normal teórica
-        contribucion_adicional = 0  # Inicializar la variable antes del bucle for
-        for j in range(5):
-            media_adicional = (j/2) - 1
-            desvio_adicional = 1 / 10
-            contribucion_adicional += norm.pdf(x, loc=media_adicional, scale=desvio_adicional)
+        return MezclaGaussiana.bart_simpson(media, desvio).densidad(x)
 
-        contribucion_adicional *= (1 / 10)
-        fBS_x = contribucion_estandar + contribucion_adicional
-        return fBS_x
+class SimulacionMonteCarlo:
+    """
+    Una clase para comparar por simulación la precisión y el costo de las estimaciones de densidad.
+
+    Para cada tamaño de muestra y réplica genera datos con GeneradoraDeDatos, estima la densidad
+    con ResumenGrafico.mi_densidad para cada kernel y ancho de ventana, y calcula el ISE
+    (error cuadrático integrado) contra la densidad teórica, junto con el tiempo y el pico de
+    memoria de cada estimación. El MISE es el promedio del ISE sobre las réplicas.
+
+    Atributos:
+    tamanos (list): Tamaños de muestra.
+    kernels (list): Kernels de mi_densidad.
+    ventanas (list): Anchos de ventana (números) o reglas de seleccionar_ventana ('silverman', 'scott', ...).
+    replicas (int): Cantidad de réplicas por tamaño de muestra.
+    distribucion (str): 'bart_simpson' o 'normal' (estándar).
+    grilla (numpy.ndarray): Puntos en los que se evalúan las densidades para integrar el error.
+    metodo (str): Método de mi_densidad.
+    semilla (int): Semilla de la que se deriva el flujo aleatorio de cada réplica.
+    """
+
+    def __init__(self, tamanos, kernels, ventanas, replicas, distribucion='bart_simpson', grilla=None,
+                 metodo='fft', semilla=0):
+        """
+        Inicializa la simulación con la grilla de configuraciones.
+
+        Args:
+        tamanos (list): Tamaños de muestra.
+        kernels (list): Kernels de mi_densidad.
+        ventanas (list): Anchos de ventana (números) o reglas de seleccionar_ventana.
+        replicas (int): Cantidad de réplicas por tamaño de muestra.
+        distribucion (str): 'bart_simpson' o 'normal'. Por defecto es 'bart_simpson'.
+        grilla (numpy.ndarray, opcional): Puntos de evaluación. Por defecto, 512 puntos entre -4 y 4.
+        metodo (str): Método de mi_densidad. Por defecto es 'fft'.
+        semilla (int): Semilla de la simulación. Por defecto es 0.
+        """
+        if distribucion not in ('bart_simpson', 'normal'):
+            raise Exception(f"Distribución desconocida: {distribucion}. Opciones: bart_simpson, normal.")
+        self.tamanos = list(tamanos)
+        self.kernels = list(kernels)
+        self.ventanas = list(ventanas)
+        self.replicas = replicas
+        self.distribucion = distribucion
+        self.grilla = np.linspace(-4, 4, 512) if grilla is None else np.asarray(grilla, dtype=float)
+        self.metodo = metodo
+        self.semilla = semilla
+
+    def ejecutar(self, trabajadores=None, archivo=None):
+        """
+        Ejecuta las réplicas pendientes y devuelve la tabla de resultados.
+
+        Cada réplica (tamaño de muestra y número de réplica) es una tarea independiente con su propio
+        flujo aleatorio, por lo que los resultados no dependen del orden de ejecución. Si se indica
+        archivo, las filas de cada réplica se agregan al CSV apenas termina, junto con la distribución,
+        la semilla, el método y una huella de la grilla. Al volver a ejecutar se omiten solo las
+        combinaciones (n, réplica, kernel, ventana) que ya están en el archivo, de modo que agregar
+        kernels o ventanas completa las réplicas existentes; si el archivo corresponde a otra
+        distribución, semilla, método o grilla se lanza una excepción.
+
+        Args:
+        trabajadores (int, opcional): Cantidad de procesos. Por defecto la ejecución es serial.
+        archivo (str, opcional): Ruta al CSV de checkpoint.
+
+        Returns:
+        DataFrame: Una fila por tamaño, réplica, kernel y ventana (como texto) con h, ISE, tiempo y pico de memoria.
+        """
+        identificacion = {'distribucion': self.distribucion, 'semilla': str(self.semilla), 'metodo': self.metodo,
+                          'grilla': hashlib.sha1(self.grilla.tobytes()).hexdigest()[:16]}
+        previas = None
+        if archivo is not None and os.path.exists(archivo):
+            previas = pd.read_csv(archivo, dtype={'kernel': str, 'ventana': str, **{c: str for c in identificacion}})
+            for columna, valor in identificacion.items():
+                if columna not in previas or (previas[columna] != valor).any():
+                    raise Exception(f"El checkpoint {archivo} no corresponde a esta simulación (difiere '{columna}').")
+        hechas = set() if previas is None else set(zip(previas['n'], previas['replica'], previas['kernel'], previas['ventana']))
+        configuracion = (self.distribucion, self.grilla, self.metodo)
+        tareas = []
+        for n in self.tamanos:
+            for replica in range(self.replicas):
+                pendientes = [(kernel, ventana) for kernel in self.kernels for ventana in self.ventanas
+                              if (n, replica, kernel, str(ventana)) not in hechas]
+                if pendientes:
+                    tareas.append((n, replica, self.semilla, pendientes, configuracion))
+
+        def guardar(filas):
+            filas = [{**fila, **identificacion} for fila in filas]
+            if archivo is not None:
+                pd.DataFrame(filas).to_csv(archivo, mode='a', index=False, header=not os.path.exists(archivo))
+            resultados.extend(filas)
+
+        resultados = []
+        if trabajadores is None:
+            for tarea in tareas:
+                guardar(SimulacionMonteCarlo.ejecutar_replica(tarea))
+        else:
+            with ProcessPoolExecutor(trabajadores) as pool:
+                futuros = [pool.submit(SimulacionMonteCarlo.ejecutar_replica, tarea) for tarea in tareas]
+                for futuro in as_completed(futuros):
+                    guardar(futuro.result())
+        tabla = pd.DataFrame(resultados)
+        if previas is not None:
+            pedidas = {(n, replica, kernel, str(ventana)) for n in self.tamanos for replica in range(self.replicas)
+                       for kernel in self.kernels for ventana in self.ventanas}
+            claves = zip(previas['n'], previas['replica'], previas['kernel'], previas['ventana'])
+            tabla = pd.concat([previas[[clave in pedidas for clave in claves]], tabla], ignore_index=True)
+        return tabla.sort_values(['n', 'replica', 'kernel', 'ventana']).reset_index(drop=True)
+
+    @staticmethod
+    def resumen(tabla):
+        """
+        Resume la tabla de resultados por configuración.
+
+        Args:
+        tabla (DataFrame): Tabla devuelta por ejecutar.
+
+        Returns:
+        DataFrame: MISE, desvío del ISE, h, tiempo y pico de memoria medios por tamaño, kernel y ventana.
+        """
+        return tabla.groupby(['n', 'kernel', 'ventana']).agg(
+            MISE=('ISE', 'mean'), desvio_ISE=('ISE', 'std'), h=('h', 'mean'),
+            tiempo=('tiempo', 'mean'), memoria_pico=('memoria_pico', 'max'))
+
+    @staticmethod
+    def ejecutar_replica(tarea):
+        """
+        Genera una muestra y la estima con cada combinación pendiente de kernel y ventana.
+
+        Args:
+        tarea (tuple): Tamaño de muestra, número de réplica, semilla, pares (kernel, ventana) a estimar
+            y configuración de la simulación.
+
+        Returns:
+        list: Filas de resultados (diccionarios) de la réplica.
+        """
+        n, replica, semilla, pendientes, (distribucion, grilla, metodo) = tarea
+        generadora = GeneradoraDeDatos(n, seed=np.random.SeedSequence([semilla, n, replica]))
+        if distribucion == 'bart_simpson':
+            datos = generadora.r_BS()
+            teorica = generadora.teorica_BS(grilla, 0, 1)
+        else:
+            datos = generadora.generar_datos_dist_norm(0, 1)
+            teorica = generadora.pdf_norm(grilla, 0, 1)
+        resumen = ResumenGrafico(datos)
+        filas = []
+        for kernel, ventana in pendientes:
+            seguir_memoria = not tracemalloc.is_tracing()
+            if seguir_memoria:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            comienzo = time.perf_counter()
+            h = resumen.seleccionar_ventana(datos, ventana, kernel) if isinstance(ventana, str) else ventana
+            estimada = np.asarray(resumen.mi_densidad(grilla, datos, h, kernel, metodo=metodo))
+            tiempo = time.perf_counter() - comienzo
+            memoria_pico = tracemalloc.get_traced_memory()[1]
+            if seguir_memoria:
+                tracemalloc.stop()
+            error = (estimada - teorica) ** 2
+            ise = np.sum(np.diff(grilla) * (error[1:] + error[:-1]) / 2)
+            filas.append({'n': n, 'replica': replica, 'kernel': kernel, 'ventana': str(ventana), 'h': h,
+                          'ISE': ise, 'tiempo': tiempo, 'memoria_pico': memoria_pico})
+        return filas
+
+class ResultadosOLS:
+    """
+    Resultados de un ajuste OLS calculados sin statsmodels.
+
+    Expone los mismos atributos que usan los métodos de RegresionLineal sobre los resultados de
+    statsmodels (params, bse, tvalues, pvalues, mse_resid, ssr, rsquared, rsquared_adj) y un
+    summary2() cuya tabla de coeficientes se arma solo cuando se pide.
+
+    Atributos:
+    params (Series): Coeficientes estimados.
+    bse (Series): Errores estándar de los coeficientes.
+    cov_sin_escalar (numpy.ndarray): Matriz (X'X)^-1.
+    nobs (int): Cantidad de observaciones.
+    df_resid (int): Grados de libertad de los residuos.
+    fittedvalues (Series): Valores ajustados (None si el ajuste fue por bloques).
+    resid (Series): Residuos (None si el ajuste fue por bloques).
+    """
+
+    def __init__(self, nombres, betas, cov_sin_escalar, ssr, centrada, n, rango, fittedvalues=None, resid=None):
+        """
+        Calcula las estadísticas del ajuste a partir de los coeficientes y (X'X)^-1.
+
+        Args:
+        nombres (list): Nombres de los coeficientes (incluida la constante).
+        betas (numpy.ndarray): Coeficientes estimados.
+        cov_sin_escalar (numpy.ndarray): Matriz (X'X)^-1.
+        ssr (float): Suma de los cuadrados de los residuos.
+        centrada (float): Suma de los cuadrados de y centrada en su media.
+        n (int): Cantidad de observaciones.
+        rango (int): Rango de la matriz de diseño.
+        fittedvalues (Series, opcional): Valores ajustados.
+        resid (Series, opcional): Residuos.
+        """
+        self.cov_sin_escalar = cov_sin_escalar
+        self.nobs = n
+        self.df_resid = n - rango
+        self.ssr = ssr
+        self.mse_resid = self.ssr / self.df_resid
+        self.rsquared = 1 - self.ssr / centrada
+        self.rsquared_adj = 1 - (1 - self.rsquared) * (n - 1) / self.df_resid
+        self.params = pd.Series(betas, index=nombres)
+        self.bse = pd.Series(np.sqrt(np.diag(cov_sin_escalar) * self.mse_resid), index=nombres)
+        self.fittedvalues = fittedvalues
+        self.resid = resid
+
+    @classmethod
+    def desde_ecuaciones_normales(cls, nombres, xtx, xty, yty, suma_y, n):
+        """
+        Resuelve las ecuaciones normales a partir de X'X, X'y e y'y.
+
+        Args:
+        nombres (list): Nombres de los coeficientes (incluida la constante).
+        xtx (numpy.ndarray): Matriz X'X, con la columna de unos incluida en X.
+        xty (numpy.ndarray): Vector X'y.
+        yty (float): Suma de los cuadrados de y.
+        suma_y (float): Suma de y.
+        n (int): Cantidad de observaciones.
+
+        Returns:
+        ResultadosOLS: Resultados del ajuste.
+        """
+        cov_sin_escalar = np.linalg.pinv(xtx)
+        betas = cov_sin_escalar @ xty
+        ssr = max(yty - betas @ xty, 0.0)
+        return cls(nombres, betas, cov_sin_escalar, ssr, yty - suma_y ** 2 / n, n, np.linalg.matrix_rank(xtx))
+
+    @classmethod
+    def desde_qr(cls, nombres, X, y, indice=None):
+        """
+        Ajusta el OLS con una descomposición QR (LAPACK) de la matriz de diseño.
+
+        Si la matriz de diseño no tiene rango completo se usa la pseudoinversa de X'X, como statsmodels.
+
+        Args:
+        nombres (list): Nombres de los coeficientes (incluida la constante).
+        X (numpy.ndarray): Matriz de diseño, con la columna de unos.
+        y (numpy.ndarray): Variable dependiente.
+        indice (Index, opcional): Índice para los valores ajustados y los residuos.
+
+        Returns:
+        ResultadosOLS: Resultados del ajuste, con valores ajustados y residuos.
+        """
+        from scipy.linalg import solve_triangular
+        q, r = np.linalg.qr(X)
+        diagonal = np.abs(np.diag(r))
+        if diagonal.min() > diagonal.max() * max(X.shape) * np.finfo(float).eps:
+            betas = solve_triangular(r, q.T @ y)
+            inversa_r = solve_triangular(r, np.eye(len(r)))
+            cov_sin_escalar = inversa_r @ inversa_r.T
+            rango = X.shape[1]
+        else:
+            cov_sin_escalar = np.linalg.pinv(X.T @ X)
+            betas = cov_sin_escalar @ (X.T @ y)
+            rango = np.linalg.matrix_rank(X)
+        ajustados = X @ betas
+        residuos = y - ajustados
+        centrada = np.sum((y - y.mean()) ** 2)
+        return cls(nombres, betas, cov_sin_escalar, residuos @ residuos, centrada, len(y), rango,
+                   pd.Series(ajustados, index=indice), pd.Series(residuos, index=indice))
+
+    @property
+    def tvalues(self):
+        """Estadísticos t de los coeficientes."""
+        return self.params / self.bse
+
+    @property
+    def pvalues(self):
+        """p-valores bilaterales de los coeficientes."""
+        from scipy.stats import t as dist_t
+        return pd.Series(2 * dist_t.sf(np.abs(self.tvalues), self.df_resid), index=self.params.index)
+
+    def conf_int(self, alpha=0.05):
+        """
+        Calcula los intervalos de confianza de los coeficientes.
+
+        Args:
+        alpha (float): Nivel de significancia. Por defecto es 0.05.
+
+        Returns:
+        DataFrame: Límites inferior y superior de cada coeficiente.
+        """
+        from scipy.stats import t as dist_t
+        cuantil = dist_t.ppf(1 - alpha / 2, self.df_resid)
+        return pd.DataFrame({0: self.params - cuantil * self.bse, 1: self.params + cuantil * self.bse})
+
+    def summary2(self):
+        """
+        Arma un resumen con la misma tabla de coeficientes que summary2() de statsmodels.
+
+        Returns:
+        SimpleNamespace: Objeto con el atributo tables; tables[1] es la tabla de coeficientes.
+        """
+        intervalos = self.conf_int()
+        coeficientes = pd.DataFrame({
+            'Coef.': self.params,
+            'Std.Err.': self.bse,
+            't': self.tvalues,
+            'P>|t|': self.pvalues,
+            '[0.025': intervalos[0],
+            '0.975]': intervalos[1]
+        })
+        modelo = pd.DataFrame({
+            0: ['No. Observations:', 'Df Residuals:', 'R-squared:', 'Adj. R-squared:', 'Scale:'],
+            1: [self.nobs, self.df_resid, self.rsquared, self.rsquared_adj, self.mse_resid]
+        })
+        return SimpleNamespace(tables=[modelo, coeficientes])
+
+class AcumuladorOLS:
+    """
+    Acumula X'X, X'y, y'y y la suma de y por bloques, para ajustar un OLS sin tener todos los datos en memoria.
+
+    Dos acumuladores calculados sobre partes distintas de los datos se combinan sumando sus matrices.
+
+    Atributos:
+    columnas (list): Nombres de las variables independientes.
+    xtx (numpy.ndarray): Matriz X'X (con la constante como primera columna).
+    xty (numpy.ndarray): Vector X'y.
+    yty (float): Suma de los cuadrados de y.
+    suma_y (float): Suma de y.
+    n (int): Cantidad de observaciones acumuladas.
+    """
+
+    def __init__(self, columnas):
+        """
+        Inicializa un acumulador vacío.
+
+        Args:
+        columnas (list): Nombres de las variables independientes.
+        """
+        self.columnas = list(columnas)
+        p = len(self.columnas) + 1
+        self.xtx = np.zeros((p, p))
+        self.xty = np.zeros(p)
+        self.yty = 0.0
+        self.suma_y = 0.0
+        self.n = 0
+
+    def actualizar(self, bloque):
+        """
+        Incorpora un bloque de filas.
+
+        Args:
+        bloque (DataFrame): Bloque con las columnas independientes y la columna 'y'.
+
+        Returns:
+        AcumuladorOLS: El mismo acumulador, actualizado.
+        """
+        y = bloque['y'].to_numpy(dtype=float)
+        X = np.empty((len(bloque), len(self.columnas) + 1))
+        X[:, 0] = 1.0
+        X[:, 1:] = bloque[self.columnas].to_numpy(dtype=float)
+        self.xtx += X.T @ X
+        self.xty += X.T @ y
+        self.yty += y @ y
+        self.suma_y += y.sum()
+        self.n += len(y)
+        return self
+
+    def combinar(self, otro):
+        """
+        Combina en este acumulador el de otra parte de los datos.
+
+        Args:
+        otro (AcumuladorOLS): Acumulador con las mismas columnas.
+
+        Returns:
+        AcumuladorOLS: El mismo acumulador, actualizado.
+        """
+        if otro.columnas != self.columnas:
+            raise Exception("Los acumuladores deben tener las mismas columnas para combinarse.")
+        self.xtx += otro.xtx
+        self.xty += otro.xty
+        self.yty += otro.yty
+        self.suma_y += otro.suma_y
+        self.n += otro.n
+        return self
+
+    def resolver(self):
+        """
+        Ajusta el modelo con lo acumulado hasta el momento.
+
+        Returns:
+        ResultadosOLS: Resultados del ajuste.
+        """
+        if self.n == 0:
+            raise Exception("El acumulador no recibió datos.")
+        return ResultadosOLS.desde_ecuaciones_normales(['const'] + self.columnas, self.xtx, self.xty,
+                                                       self.yty, self.suma_y, self.n)
 
 class Regresion():
     """
@@ -363,9 +2002,17 @@ class Regresion():
     Atributos:
     datos (DataFrame): Conjunto de datos utilizado para la regresión.
     y (Series): Variable dependiente para la regresión.
+    version_datos (int): Versión de los datos; cambia con invalidar_cache().
+    tipo_diseno (numpy.dtype): Tipo de la matriz de diseño usada en los ajustes (np.float64 o np.float32).
 
     Métodos:
     __init__(datos, y=None): Inicializa la clase con los datos y la variable dependiente opcional.
+    matriz_diseno(columnas=None, dtype=None): Devuelve la matriz de diseño con la constante, armada una sola vez.
+    vector_respuesta(dtype=None): Devuelve y como arreglo, armado una sola vez.
+    verificar_datos_completos(): Lanza una excepción si el ajuste incluye filas que no están en self.datos.
+    invalidar_cache(): Descarta las matrices guardadas tras modificar los datos.
+    evaluar(X, y): Calcula el error cuadrático medio (ECM).
+    validacion_cruzada(k=5, grilla=None): Evalúa el modelo en k pliegues para cada configuración de una grilla.
     """
     def __init__(self, datos,y):
         self.datos = datos
@@ -375,14 +2022,191 @@ class Regresion():
         self.resultados = None
         self.n = len(self.y)
         self.k = len(self.x.columns)
+        self.version_datos = 0
+        self.tipo_diseno = np.float64
+        self._cache_diseno = {}
+
+    def verificar_datos_completos(self):
+        """
+        Verifica que self.datos contenga todas las filas del ajuste actual.
+
+        Después de agregar_datos, el ajuste incluye filas que no están en self.datos; los métodos
+        que usan los datos completos no deben usar self.x como si fueran todos los datos.
+        """
+        acumulador = getattr(self, 'acumulador', None)
+        if acumulador is not None and acumulador.n != len(self.x):
+            raise Exception(f"El ajuste incremental incluye {acumulador.n - len(self.x)} filas agregadas con agregar_datos "
+                            f"que no están en self.datos. Llame a invalidar_cache() para volver a usar solo self.datos.")
+
+    def matriz_diseno(self, columnas=None, dtype=None):
+        """
+        Devuelve la matriz de diseño (constante y variables independientes) como un arreglo contiguo.
+
+        La matriz se arma una sola vez por versión de los datos, selección de columnas y tipo, y la
+        comparten los ajustes, las predicciones y los gráficos, en lugar de que cada uno copie los
+        datos con sm.add_constant. El arreglo es de solo lectura.
+
+        Parámetros:
+        columnas (list, opcional): Variables independientes, en el orden de los coeficientes. Por defecto, todas.
+        dtype (numpy.dtype, opcional): np.float64 o np.float32. Por defecto, self.tipo_diseno.
+
+        Retorna:
+        numpy.ndarray: Matriz de n x (columnas + 1) con la constante en la primera columna.
+        """
+        self.verificar_datos_completos()
+        columnas = tuple(self.x.columns if columnas is None else columnas)
+        dtype = np.dtype(self.tipo_diseno if dtype is None else dtype)
+        clave = (self.version_datos, columnas, dtype.str)
+        if clave not in self._cache_diseno:
+            X = np.empty((len(self.x), len(columnas) + 1), dtype=dtype)
+            X[:, 0] = 1.0
+            X[:, 1:] = self.x[list(columnas)].to_numpy(dtype=dtype)
+            X.flags.writeable = False
+            self._cache_diseno[clave] = X
+        return self._cache_diseno[clave]
+
+    def vector_respuesta(self, dtype=None):
+        """
+        Devuelve la variable dependiente como arreglo, armado una sola vez por versión de los datos.
+
+        Parámetros:
+        dtype (numpy.dtype, opcional): np.float64 o np.float32. Por defecto, self.tipo_diseno.
+
+        Retorna:
+        numpy.ndarray: Vector y.
+        """
+        self.verificar_datos_completos()
+        dtype = np.dtype(self.tipo_diseno if dtype is None else dtype)
+        clave = (self.version_datos, 'y', dtype.str)
+        if clave not in self._cache_diseno:
+            y = self.y.to_numpy(dtype=dtype, copy=True)
+            y.flags.writeable = False
+            self._cache_diseno[clave] = y
+        return self._cache_diseno[clave]
+
+    def invalidar_cache(self):
+        """
+        Descarta las matrices y resultados intermedios guardados.
+
+        Debe llamarse después de modificar self.datos en el lugar; las siguientes llamadas a
+        matriz_diseno y vector_respuesta vuelven a armarlos con la nueva versión de los datos.
+        También descarta el acumulador de un ajuste incremental (y sus filas agregadas).
+        """
+        self.y = self.datos['y']
+        self.x = self.datos.drop('y', axis=1)
+        self.n = len(self.y)
+        self.k = len(self.x.columns)
+        self.version_datos += 1
+        self._cache_diseno = {}
+        self._cache_prediccion = None
+        self._cache_proba_test = None
+        self.acumulador = None
 
     def evaluar(self, X, y):
         """
         Calcula el error cuadrático medio (ECM)
         """
         predicciones = self.predecir(X)
+        if isinstance(predicciones, dict):
+            predicciones = predicciones['Resultado_predicion']
         return ((predicciones - y) ** 2).mean()
 
+    def validacion_cruzada(self, k=5, grilla=None, seed=None, trabajadores=None, estratificar=False, repeticiones=1):
+        """
+        Evalúa el modelo por validación cruzada en k pliegues para cada configuración de una grilla.
+
+        Cada combinación de pliegue y configuración se ajusta con el motor de NumPy de la subclase
+        (QR para la lineal, IRLS para la logística). Con trabajadores, las tareas se reparten en un
+        pool de procesos; la matriz de diseño, y y las asignaciones de pliegues se copian una sola
+        vez a memoria compartida y cada tarea recibe solo su número de pliegue y su configuración.
+
+        Parámetros:
+        k (int): Cantidad de pliegues. Por defecto es 5.
+        grilla (list, opcional): Lista de diccionarios de configuración. Claves admitidas: 'columnas'
+            (variables independientes a usar) y, en la logística, 'umbral'. Por defecto, una configuración con todas las columnas.
+        seed (int o numpy.random.Generator): Semilla o generador para asignar los pliegues. Por defecto es None.
+        trabajadores (int, opcional): Cantidad de procesos. Por defecto las tareas se ejecutan en forma serial.
+        estratificar (bool): Si los pliegues conservan la proporción de cada valor de y. Por defecto es False.
+        repeticiones (int): Cantidad de repeticiones de la división en k pliegues. Por defecto es 1.
+
+        Retorna:
+        DataFrame: Una fila por configuración, repetición y pliegue con las métricas de la subclase
+        (ECM para la lineal; error_total, sensibilidad, especificidad y AUC para la logística).
+        """
+        if grilla is None:
+            grilla = [{}]
+        columnas = list(self.x.columns)
+        # Columnas del arreglo compartido: y, constante, variables independientes y un pliegue por repetición
+        datos = np.empty((len(self.x), 2 + self.k + repeticiones))
+        datos[:, 0] = self.vector_respuesta(np.float64)
+        datos[:, 1:2 + self.k] = self.matriz_diseno(dtype=np.float64)
+        particiones = Particion.k_fold(self.datos, k, seed, estratificar, repeticiones)
+        for numero, particion in enumerate(particiones):
+            datos[particion.indices_test, 2 + self.k + numero // k] = numero % k
+
+        tareas = []
+        for configuracion, parametros in enumerate(grilla):
+            usadas = [0] + [1 + columnas.index(c) for c in parametros.get('columnas', columnas)]
+            for repeticion in range(repeticiones):
+                for pliegue in range(k):
+                    tareas.append((type(self), configuracion, repeticion, pliegue, usadas, parametros))
+
+        if trabajadores is None:
+            filas = [Regresion.evaluar_pliegue(datos, self.k, tarea) for tarea in tareas]
+        else:
+            memoria = shared_memory.SharedMemory(create=True, size=datos.nbytes)
+            try:
+                compartidos = np.ndarray(datos.shape, dtype=datos.dtype, buffer=memoria.buf)
+                compartidos[:] = datos
+                with ProcessPoolExecutor(trabajadores) as pool:
+                    filas = list(pool.map(Regresion.evaluar_pliegue_compartido,
+                                          [(memoria.name, datos.shape, self.k, tarea) for tarea in tareas]))
+                del compartidos
+            finally:
+                memoria.close()
+                memoria.unlink()
+        return pd.DataFrame(filas)
+
+    @staticmethod
+    def evaluar_pliegue(datos, k, tarea):
+        """
+        Ajusta el modelo sin el pliegue indicado y calcula las métricas sobre ese pliegue.
+
+        Parámetros:
+        datos (numpy.ndarray): Arreglo con y, la constante, las variables independientes y los pliegues.
+        k (int): Cantidad de variables independientes.
+        tarea (tuple): Clase del modelo, configuración, repetición, pliegue, columnas usadas y parámetros.
+
+        Retorna:
+        dict: Identificación de la tarea y métricas del pliegue.
+        """
+        clase, configuracion, repeticion, pliegue, usadas, parametros = tarea
+        prueba = datos[:, 2 + k + repeticion] == pliegue
+        diseno = datos[:, 1:2 + k][:, usadas]
+        metricas = clase.metricas_pliegue(diseno[~prueba], datos[~prueba, 0], diseno[prueba], datos[prueba, 0], parametros)
+        return {'configuracion': configuracion, 'repeticion': repeticion, 'pliegue': pliegue, **metricas}
+
+    @staticmethod
+    def evaluar_pliegue_compartido(tarea):
+        """
+        Evalúa un pliegue leyendo los datos desde memoria compartida.
+
+        Parámetros:
+        tarea (tuple): Nombre de la memoria compartida, forma del arreglo, cantidad de variables y tarea de evaluar_pliegue.
+
+        Retorna:
+        dict: Identificación de la tarea y métricas del pliegue.
+        """
+        nombre, forma, k, tarea = tarea
+        memoria = shared_memory.SharedMemory(name=nombre)
+        try:
+            datos = np.ndarray(forma, dtype=np.float64, buffer=memoria.buf)
+            fila = Regresion.evaluar_pliegue(datos, k, tarea)
+            del datos
+        finally:
+            memoria.close()
+        return fila
+
 class RegresionLineal(Regresion, ResumenGrafico):
     """
     Clase para realizar regresiones lineales.
@@ -395,70 +2219,301 @@ class RegresionLineal(Regresion, ResumenGrafico):
     resultados (RegressionResults): Resultados del ajuste del modelo.
 
     Métodos:
-    ajustar(): Ajusta el modelo de regresión lineal.
+    ajustar(motor='statsmodels'): Ajusta el modelo de regresión lineal (con statsmodels o con QR de NumPy).
+    ajustar_incremental(bloques): Ajusta el modelo acumulando X'X y X'y por bloques.
+    agregar_datos(*bloques): Agrega filas a un ajuste incremental sin reajustar desde cero.
+    ajustar_por_grupos(datos, grupo): Ajusta la misma regresión para cada grupo en forma vectorizada.
     predecir(x, alfa=0.05): Realiza predicciones con el modelo ajustado y devuelve intervalos de confianza y predicción.
-    graficar(): Grafica la dispersión de los datos y la recta de mejor ajuste.
+    graficar(archivo=None, max_puntos=5000): Grafica la dispersión de los datos y la recta de mejor ajuste.
     calcular_coeficiente_correlacion(): Calcula los coeficientes de correlación entre las variables independientes y la variable dependiente.
-    analizar_residuos(): Realiza un análisis de los residuos del modelo ajustado.
+    analizar_residuos(archivo=None, max_puntos=5000): Realiza un análisis de los residuos del modelo ajustado.
     varianza_res(): Calcula la varianza residual del modelo ajustado.
     estadisticas(): Devuelve estadísticas del modelo ajustado.
     """
-    def ajustar(self):
+    def ajustar(self, motor='statsmodels'):
         """
         Ajusta el modelo de regresión lineal.
 
-        Agrega una constante a las variables independientes y ajusta un modelo OLS.
+        Usa la matriz de diseño guardada (con la constante) y ajusta un modelo OLS. Con
+        motor='numpy' el ajuste se hace con una descomposición QR, sin construir los objetos
+        de statsmodels; el summary2() se arma solo cuando estadisticas() lo pide.
+
+        Parámetros:
+        motor (str): 'statsmodels' o 'numpy'. Por defecto es 'statsmodels'.
+
+        Retorna:
+        self.resultados (RegressionResults o ResultadosOLS): Resultados del ajuste del modelo.
+        """
+        X = self.matriz_diseno()
+        if motor == 'numpy':
+            self.modelo = None
+            self.resultados = ResultadosOLS.desde_qr(['const'] + list(self.x.columns), X,
+                                                     self.vector_respuesta(), self.y.index)
+        elif motor == 'statsmodels':
+            import statsmodels.api as sm
+            X = pd.DataFrame(X, index=self.x.index, columns=['const'] + list(self.x.columns), copy=False)
+            self.modelo = sm.OLS(self.y, X)
+            self.resultados = self.modelo.fit()
+        else:
+            raise Exception(f"Motor desconocido: {motor}. Opciones: statsmodels, numpy.")
+        self.scale = self.varianza_res()
+        self.ssr = self.calcular_ssr()
+        self.df_resid = len(self.x) - self.k
+        return self.resultados
+
+    def ajustar_incremental(self, bloques=()):
+        """
+        Ajusta el modelo de regresión lineal acumulando X'X y X'y por bloques.
+
+        Incluye los datos con los que se creó el objeto y luego los bloques indicados, sin armar
+        la matriz de diseño completa. Los resultados exponen las mismas estadísticas que ajustar()
+        (betas, errores estándar, mse_resid, ssr, R2), salvo los residuos y valores ajustados.
+
+        Parámetros:
+        bloques (iterable): Bloques (DataFrames con las mismas columnas y la columna 'y') a agregar.
+
+        Retorna:
+        self.resultados (ResultadosOLS): Resultados del ajuste.
+        """
+        self.acumulador = AcumuladorOLS(self.x.columns).actualizar(self.datos)
+        return self.agregar_datos(*bloques)
+
+    def agregar_datos(self, *bloques):
+        """
+        Agrega filas nuevas a un ajuste incremental y actualiza los resultados sin reajustar desde cero.
+
+        Las filas agregadas solo quedan en el acumulador (self.acumulador.n y self.resultados.nobs);
+        self.datos, self.x, self.y y self.n no cambian. Mientras haya filas agregadas, los métodos que
+        recorren todos los datos (ajustar, graficar, validacion_cruzada, ...) lanzan una excepción en
+        lugar de usar self.datos incompletos, hasta que se llame a invalidar_cache().
+
+        Parámetros:
+        *bloques (DataFrame): Bloques con las mismas columnas y la columna 'y'.
+
         Retorna:
-        self.resultados (RegressionResults): Resultados del ajuste del modelo.
+        self.resultados (ResultadosOLS): Resultados del ajuste actualizado.
         """
-        X = sm.add_constant(self.x)
-        self.modelo = sm.OLS(self.y, X)
-        self.resultados = self.modelo.fit()
+        if getattr(self, 'acumulador', None) is None:
+            raise Exception("El modelo debe ajustarse con ajustar_incremental antes de agregar datos.")
+        for bloque in bloques:
+            self.acumulador.actualizar(bloque)
+        self.resultados = self.acumulador.resolver()
         self.scale = self.varianza_res()
         self.ssr = self.calcular_ssr()
-        self.df_resid = self.n - self.k
+        self.df_resid = self.acumulador.n - self.k
         return self.resultados
 
-    def predecir(self,x, alfa = 0.05):
-      """
+    @staticmethod
+    def metricas_pliegue(X_train, y_train, X_test, y_test, parametros):
+        """
+        Ajusta el OLS con los datos de entrenamiento de un pliegue y calcula el ECM en el de prueba.
+
+        Parámetros:
+        X_train (numpy.ndarray): Matriz de diseño de entrenamiento (con la constante).
+        y_train (numpy.ndarray): Variable dependiente de entrenamiento.
+        X_test (numpy.ndarray): Matriz de diseño de prueba (con la constante).
+        y_test (numpy.ndarray): Variable dependiente de prueba.
+        parametros (dict): Configuración de la grilla (no se usan parámetros adicionales).
+
+        Retorna:
+        dict: Diccionario con el ECM.
+        """
+        betas = np.linalg.lstsq(X_train, y_train, rcond=None)[0]
+        return {'ECM': np.mean((X_test @ betas - y_test) ** 2)}
+
+    @staticmethod
+    def ajustar_por_grupos(datos, grupo, trabajadores=None, tam_bloque=2 ** 16):
+        """
+        Ajusta la misma regresión lineal por separado para cada grupo, en forma vectorizada.
+
+        En lugar de crear un RegresionLineal por grupo, acumula X'X, X'y e y'y de todos los grupos
+        a la vez (con np.bincount por cada par de columnas) y resuelve las ecuaciones normales de
+        todos los grupos con una única llamada a np.linalg.pinv sobre las matrices apiladas.
+
+        Parámetros:
+        datos (DataFrame): Datos con la columna 'y', la columna de grupo y las variables independientes
+            (las columnas no numéricas se ignoran y las filas con grupo faltante se descartan).
+        grupo (str): Nombre de la columna que identifica el grupo.
+        trabajadores (int, opcional): Cantidad de procesos entre los que se reparten los bloques de filas. Por defecto es serial.
+        tam_bloque (int): Cantidad de filas por bloque. Por defecto es 2 ** 16.
+
+        Retorna:
+        DataFrame: Una fila por grupo con n, los betas (beta_*), los errores estándar (ee_*), R2, R2_ajustado y la varianza residual.
+        """
+        columnas = [columna for columna in datos.select_dtypes(include=np.number).columns if columna not in ('y', grupo)]
+        codigos, grupos = pd.factorize(datos[grupo], sort=True)
+        # Como groupby(dropna=True): las filas sin grupo (código -1) no se ajustan
+        con_grupo = codigos >= 0
+        if not con_grupo.all():
+            datos, codigos = datos[con_grupo], codigos[con_grupo]
+        X = np.empty((len(datos), len(columnas) + 1))
+        X[:, 0] = 1.0
+        X[:, 1:] = datos[columnas].to_numpy(dtype=float)
+        y = datos['y'].to_numpy(dtype=float)
+        tareas = [(X[i:i + tam_bloque], y[i:i + tam_bloque], codigos[i:i + tam_bloque], len(grupos))
+                  for i in range(0, len(y), tam_bloque)]
+        if trabajadores is None:
+            partes = map(RegresionLineal.sumas_por_grupo, tareas)
+        else:
+            with ProcessPoolExecutor(trabajadores) as pool:
+                partes = list(pool.map(RegresionLineal.sumas_por_grupo, tareas))
+        xtx, xty, yty, suma_y, n = [sum(suma) for suma in zip(*partes)]
+
+        cov_sin_escalar = np.linalg.pinv(xtx, hermitian=True)
+        betas = np.einsum('gij,gj->gi', cov_sin_escalar, xty)
+        rango = np.linalg.matrix_rank(xtx, hermitian=True)
+        df_resid = n - rango
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ssr = np.maximum(yty - np.einsum('gi,gi->g', betas, xty), 0.0)
+            mse_resid = ssr / df_resid
+            r2 = 1 - ssr / (yty - suma_y ** 2 / n)
+            errores = np.sqrt(np.diagonal(cov_sin_escalar, axis1=1, axis2=2) * mse_resid[:, np.newaxis])
+            r2_ajustado = 1 - (1 - r2) * (n - 1) / df_resid
+        nombres = ['const'] + columnas
+        tabla = pd.DataFrame({'n': n.astype(int)}, index=pd.Index(grupos, name=grupo))
+        for j, nombre in enumerate(nombres):
+            tabla[f'beta_{nombre}'] = betas[:, j]
+        for j, nombre in enumerate(nombres):
+            tabla[f'ee_{nombre}'] = errores[:, j]
+        tabla['R2'] = r2
+        tabla['R2_ajustado'] = r2_ajustado
+        tabla['varianza_res'] = mse_resid
+        return tabla
+
+    @staticmethod
+    def sumas_por_grupo(tarea):
+        """
+        Calcula X'X, X'y, y'y, la suma de y y la cantidad de filas de cada grupo en un bloque de filas.
+
+        Parámetros:
+        tarea (tuple): Matriz de diseño (con la constante), y, códigos de grupo y cantidad de grupos.
+
+        Retorna:
+        tuple: Arreglos apilados por grupo (xtx, xty, yty, suma_y, n).
+        """
+        X, y, codigos, cantidad = tarea
+        p = X.shape[1]
+        xtx = np.empty((cantidad, p, p))
+        for i in range(p):
+            for j in range(i, p):
+                xtx[:, i, j] = xtx[:, j, i] = np.bincount(codigos, weights=X[:, i] * X[:, j], minlength=cantidad)
+        xty = np.column_stack([np.bincount(codigos, weights=X[:, i] * y, minlength=cantidad) for i in range(p)])
+        yty = np.bincount(codigos, weights=y * y, minlength=cantidad)
+        suma_y = np.bincount(codigos, weights=y, minlength=cantidad)
+        n = np.bincount(codigos, minlength=cantidad).astype(float)
+        return xtx, xty, yty, suma_y, n
+
+    def predecir(self, x, alfa=0.05, tam_bloque=2 ** 18, dtype=np.float64):
+        """
         Realiza predicciones con el modelo ajustado.
 
+        Los betas, (X'X)^-1, la varianza residual y el valor crítico t de cada alfa se guardan la
+        primera vez y se reutilizan mientras no cambie el ajuste. Las predicciones y los intervalos
+        se calculan en forma vectorizada, por bloques de filas.
+
         Parámetros:
-        x (DataFrame): Datos para realizar la predicción.
+        x (DataFrame o array-like): Datos para realizar la predicción (sin la constante), una fila por observación.
         alfa (float): Nivel de significancia para los intervalos de confianza y predicción. Por defecto es 0.05.
+        tam_bloque (int): Cantidad de filas por bloque. Por defecto es 2 ** 18.
+        dtype (numpy.dtype): Tipo de los arreglos devueltos (por ejemplo np.float32 para ahorrar memoria). Por defecto es np.float64.
 
         Retorna:
         diccionario_pred (dict): Diccionario con el resultado de la predicción, el intervalo de confianza y el intervalo de predicción.
-      """
-      if self.resultados is None:
+        """
+        from scipy.stats import t as dist_t
+        if self.resultados is None:
             raise Exception("El modelo debe ser ajustado antes de calcular intervalos.")
-      X_prediccion = np.inter(x,0,1)
-      prediccion = self.resultados.get_prediction(X_prediccion)
-      diccionario_pred ={
-        'Resultado_predicion':prediccion.predicted_mean,
-        'intervalo_confianza':prediccion.conf_int(alfa),
-        'intervalo_prediccion':prediccion.conf_int(obs=True, alpha = alfa)
+        cache = self.cache_prediccion()
+        if alfa not in cache['t']:
+            cache['t'][alfa] = dist_t.ppf(1 - alfa / 2, cache['df_resid'])
+        t_critico = cache['t'][alfa]
+        if isinstance(x, pd.DataFrame):
+            x = x[self.x.columns].to_numpy(dtype=float)
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            x = x.reshape(1, -1) if len(x) == self.k else x[:, np.newaxis]
+        betas, cov = cache['betas'], cache['cov_sin_escalar']
+
+        n = len(x)
+        prediccion = np.empty(n, dtype=dtype)
+        intervalo_confianza = np.empty((n, 2), dtype=dtype)
+        intervalo_prediccion = np.empty((n, 2), dtype=dtype)
+        for inicio in range(0, n, tam_bloque):
+            bloque = x[inicio:inicio + tam_bloque]
+            media = betas[0] + bloque @ betas[1:]
+            # x0' (X'X)^-1 x0 con x0 = [1, bloque], sin armar la matriz con la constante
+            cuadratica = (cov[0, 0] + 2 * bloque @ cov[1:, 0]
+                          + np.einsum('ij,jk,ik->i', bloque, cov[1:, 1:], bloque))
+            var_media = cache['mse_resid'] * cuadratica
+            radio_confianza = t_critico * np.sqrt(var_media)
+            radio_prediccion = t_critico * np.sqrt(var_media + cache['mse_resid'])
+            fin = inicio + len(bloque)
+            prediccion[inicio:fin] = media
+            intervalo_confianza[inicio:fin, 0] = media - radio_confianza
+            intervalo_confianza[inicio:fin, 1] = media + radio_confianza
+            intervalo_prediccion[inicio:fin, 0] = media - radio_prediccion
+            intervalo_prediccion[inicio:fin, 1] = media + radio_prediccion
+        diccionario_pred = {
+            'Resultado_predicion': prediccion,
+            'intervalo_confianza': intervalo_confianza,
+            'intervalo_prediccion': intervalo_prediccion
         }
-      return diccionario_pred
+        return diccionario_pred
 
-    def graficar(self):
+    def cache_prediccion(self):
+        """
+        Devuelve las cantidades del ajuste que usa predecir, calculándolas una vez por ajuste.
+
+        Retorna:
+        dict: Betas, (X'X)^-1, varianza residual, grados de libertad y valores críticos t por alfa.
+        """
+        cache = getattr(self, '_cache_prediccion', None)
+        if cache is None or cache['resultados'] is not self.resultados:
+            resultados = self.resultados
+            cov = getattr(resultados, 'cov_sin_escalar', None)
+            if cov is None:
+                cov = resultados.normalized_cov_params
+            cache = {
+                'resultados': resultados,
+                'betas': np.asarray(resultados.params, dtype=float),
+                'cov_sin_escalar': np.asarray(cov, dtype=float),
+                'mse_resid': float(resultados.mse_resid),
+                'df_resid': float(resultados.df_resid),
+                't': {}
+            }
+            self._cache_prediccion = cache
+        return cache
+
+    def graficar(self, archivo=None, max_puntos=5000):
         """
         Grafica la dispersión de los datos y la recta de mejor ajuste.
 
         Genera gráficos de dispersión para cada variable independiente junto con la recta de mejor ajuste.
+        Las rectas de regresión simple de todas las columnas salen de una única pasada vectorizada
+        (covarianzas y varianzas), sin ajustar un modelo por columna, y se dibujan con sus dos extremos.
+
+        Parámetros:
+        archivo (str, opcional): Ruta del archivo de imagen. Si se indica, cada gráfico se guarda
+        (con el nombre de la columna como sufijo) en lugar de mostrarse.
+        max_puntos (int, opcional): Cantidad de puntos a partir de la cual la dispersión se agrupa en hexágonos.
         """
         if self.resultados is None:
             raise Exception("El modelo debe ser ajustado antes de graficar la dispersión y la recta.")
-        for columna in self.x.columns:
-            plt.figure(figsize=(10, 6))
-            plt.scatter(x=self.x[columna], y=self.y, label='Datos')
-            X_const = sm.add_constant(self.x[columna])
-            predicciones = sm.OLS(self.y, X_const).fit().predict(X_const)
-            plt.plot(self.x[columna], predicciones, color='red', label='Recta de mejor ajuste')
-            plt.title(f'Dispersión y recta de mejor ajuste para {columna}')
-            plt.xlabel(columna)
-            plt.ylabel('Respuesta')
-            plt.show()
+        X = self.matriz_diseno()[:, 1:]
+        y = self.vector_respuesta()
+        medias_x, media_y = X.mean(axis=0), y.mean()
+        pendientes = ((X - medias_x).T @ (y - media_y)) / np.sum((X - medias_x) ** 2, axis=0)
+        ordenadas = media_y - pendientes * medias_x
+        extremos = np.vstack([X.min(axis=0), X.max(axis=0)])
+        for j, columna in enumerate(self.x.columns):
+            ruta = archivo if archivo is None or len(self.x.columns) == 1 else self.ruta_con_sufijo(archivo, columna)
+            figura, ejes = self.nueva_figura(ruta)
+            self.dispersion(ejes, X[:, j], y, max_puntos, label='Datos')
+            ejes.plot(extremos[:, j], ordenadas[j] + pendientes[j] * extremos[:, j], color='red', label='Recta de mejor ajuste')
+            ejes.set_title(f'Dispersión y recta de mejor ajuste para {columna}')
+            ejes.set_xlabel(columna)
+            ejes.set_ylabel('Respuesta')
+            self.cerrar_figura(figura, ruta)
         return
 
     def calcular_coeficiente_correlacion(self):
@@ -470,36 +2525,44 @@ class RegresionLineal(Regresion, ResumenGrafico):
         """
         if self.resultados is None:
             raise Exception("El modelo debe ser ajustado antes de calcular los coeficientes de correlación.")
+        self.verificar_datos_completos()
         correlaciones = {}
         for columna in self.x.columns:
             correlacion = self.x[columna].corr(self.y)
             correlaciones[columna] = correlacion
         return correlaciones
 
-    def analizar_residuos(self):
+    def analizar_residuos(self, archivo=None, max_puntos=5000):
         """
         Realiza un análisis de los residuos del modelo ajustado.
 
-        Genera gráficos de residuos vs. valores predichos y un gráfico Q-Q de los residuos.
+        Genera gráficos de residuos vs. valores predichos y un gráfico Q-Q de los residuos, usando
+        los valores ajustados y residuos ya guardados en los resultados.
+
+        Parámetros:
+        archivo (str, opcional): Ruta base de los archivos de imagen. Si se indica, los gráficos se
+        guardan con los sufijos 'residuos' y 'qq' en lugar de mostrarse.
+        max_puntos (int, opcional): Cantidad máxima de puntos a graficar individualmente.
         """
         if self.resultados is None:
             raise Exception("El modelo debe ser ajustado antes de realizar el análisis de residuos.")
+        if self.resultados.fittedvalues is None:
+            raise Exception("El ajuste por bloques no guarda los valores ajustados; no se pueden graficar los residuos.")
         self.residuos = self.resultados.resid
         predicciones = self.resultados.fittedvalues
 
-
-        plt.figure(figsize=(10, 6))
-        plt.plot(x=predicciones, y=self.residuos)
-        plt.axhline(0, color='red', linestyle='--')
-        plt.title('Residuos vs. Valores predichos')
-        plt.xlabel('Valores predichos')
-        plt.ylabel('Residuos')
-        plt.show()
+        ruta = self.ruta_con_sufijo(archivo, 'residuos')
+        figura, ejes = self.nueva_figura(ruta)
+        self.dispersion(ejes, predicciones, self.residuos, max_puntos)
+        ejes.axhline(0, color='red', linestyle='--')
+        ejes.set_title('Residuos vs. Valores predichos')
+        ejes.set_xlabel('Valores predichos')
+        ejes.set_ylabel('Residuos')
+        self.cerrar_figura(figura, ruta)
 
         # Gráfico Q-Q
-        ResumenGrafico.mi_qqplot(self.residuos)
-        plt.title('Gráfico Q-Q de los residuos')
-        plt.show()
+        self.miqqplot(self.residuos, self.ruta_con_sufijo(archivo, 'qq'), max_puntos, 'Gráfico Q-Q de los residuos')
+
     def varianza_res(self):
         """
         Calcula la varianza residual del modelo ajustado.
@@ -558,6 +2621,349 @@ class RegresionLineal(Regresion, ResumenGrafico):
         r2_ajustado = self.resultados.rsquared_adj
         return {'R2': r2, 'R2_ajustado': r2_ajustado}
 
+class ResultadosLogit:
+    """
+    Resultados de un ajuste logístico calculado sin statsmodels (IRLS o L-BFGS).
+
+    Expone los atributos que usa RegresionLogistica sobre los resultados de statsmodels
+    (params, bse, tvalues, pvalues, summary2() y predict()).
+
+    Atributos:
+    params (Series): Coeficientes estimados.
+    bse (Series): Errores estándar, a partir de la inversa de la matriz de información X'WX.
+    llf (float): Log-verosimilitud en el óptimo.
+    nobs (int): Cantidad de observaciones.
+    """
+
+    def __init__(self, nombres, betas, hessiana, llf, n):
+        """
+        Calcula los errores estándar a partir de la matriz de información en el óptimo.
+
+        Args:
+        nombres (list): Nombres de los coeficientes (incluida la constante).
+        betas (numpy.ndarray): Coeficientes estimados.
+        hessiana (numpy.ndarray): Matriz de información X'WX en el óptimo.
+        llf (float): Log-verosimilitud en el óptimo.
+        n (int): Cantidad de observaciones.
+        """
+        self.params = pd.Series(betas, index=nombres)
+        self.cov_params_ = np.linalg.pinv(hessiana)
+        self.bse = pd.Series(np.sqrt(np.diag(self.cov_params_)), index=nombres)
+        self.llf = llf
+        self.nobs = n
+
+    @property
+    def tvalues(self):
+        """Estadísticos z de los coeficientes."""
+        return self.params / self.bse
+
+    @property
+    def pvalues(self):
+        """p-valores bilaterales de los coeficientes."""
+        from scipy.stats import norm
+        return pd.Series(2 * norm.sf(np.abs(self.tvalues)), index=self.params.index)
+
+    def predict(self, X):
+        """
+        Calcula las probabilidades predichas.
+
+        Args:
+        X (DataFrame o numpy.ndarray): Matriz de diseño, con la constante como primera columna.
+
+        Returns:
+        numpy.ndarray: Probabilidades predichas.
+        """
+        from scipy.special import expit
+        return expit(np.asarray(X, dtype=float) @ self.params.to_numpy())
+
+    def summary2(self):
+        """
+        Arma un resumen con la misma tabla de coeficientes que summary2() de statsmodels.
+
+        Returns:
+        SimpleNamespace: Objeto con el atributo tables; tables[1] es la tabla de coeficientes.
+        """
+        from scipy.stats import norm
+        cuantil = norm.ppf(0.975)
+        coeficientes = pd.DataFrame({
+            'Coef.': self.params,
+            'Std.Err.': self.bse,
+            'z': self.tvalues,
+            'P>|z|': self.pvalues,
+            '[0.025': self.params - cuantil * self.bse,
+            '0.975]': self.params + cuantil * self.bse
+        })
+        modelo = pd.DataFrame({
+            0: ['No. Observations:', 'Log-Likelihood:'],
+            1: [self.nobs, self.llf]
+        })
+        return SimpleNamespace(tables=[modelo, coeficientes])
+
+class Particion:
+    """
+    Una partición de entrenamiento y prueba guardada como arreglos de índices posicionales.
+
+    Los conjuntos de entrenamiento y prueba se materializan (con iloc) la primera vez que se
+    accede a X_train, X_test, y_train o y_test, y se guardan: las lecturas siguientes devuelven
+    el mismo DataFrame o Series sin volver a copiar. X e y de un mismo conjunto salen de una
+    única copia de sus filas. Si se reemplazan indices_train o indices_test, el conjunto
+    correspondiente se vuelve a materializar.
+
+    Atributos:
+    datos (DataFrame): Conjunto de datos completo, con la columna 'y' (no se copia).
+    indices_train (numpy.ndarray): Posiciones de las filas de entrenamiento.
+    indices_test (numpy.ndarray): Posiciones de las filas de prueba.
+    """
+
+    orden_tupla = ('y_train', 'y_test', 'X_train', 'X_test')
+
+    def __init__(self, datos, indices_train, indices_test):
+        """
+        Inicializa la partición con los datos y los índices de cada conjunto.
+
+        Args:
+        datos (DataFrame): Conjunto de datos completo, con la columna 'y'.
+        indices_train (numpy.ndarray): Posiciones de las filas de entrenamiento.
+        indices_test (numpy.ndarray): Posiciones de las filas de prueba.
+        """
+        self.datos = datos
+        self.indices_train = indices_train
+        self.indices_test = indices_test
+        self._conjuntos = {}
+
+    def conjunto(self, nombre):
+        """
+        Devuelve las variables independientes y la dependiente de un conjunto, materializándolas una vez.
+
+        Args:
+        nombre (str): 'train' o 'test'.
+
+        Returns:
+        tuple: DataFrame X y Series y del conjunto.
+        """
+        indices = self.indices_train if nombre == 'train' else self.indices_test
+        guardado = self._conjuntos.get(nombre)
+        if guardado is None or guardado[0] is not indices:
+            filas = self.datos.iloc[indices]
+            guardado = (indices, filas.drop('y', axis=1), filas['y'])
+            self._conjuntos[nombre] = guardado
+        return guardado[1], guardado[2]
+
+    @property
+    def X_train(self):
+        """Variables independientes del conjunto de entrenamiento."""
+        return self.conjunto('train')[0]
+
+    @property
+    def X_test(self):
+        """Variables independientes del conjunto de prueba."""
+        return self.conjunto('test')[0]
+
+    @property
+    def y_train(self):
+        """Variable dependiente del conjunto de entrenamiento."""
+        return self.conjunto('train')[1]
+
+    @property
+    def y_test(self):
+        """Variable dependiente del conjunto de prueba."""
+        return self.conjunto('test')[1]
+
+    def __iter__(self):
+        """
+        Permite desempaquetar la partición como y_train, y_test, X_train, X_test.
+        """
+        return (getattr(self, nombre) for nombre in self.orden_tupla)
+
+    def __len__(self):
+        """
+        Cantidad de elementos de la partición vista como tupla (y_train, y_test, X_train, X_test).
+        """
+        return len(self.orden_tupla)
+
+    def __getitem__(self, indice):
+        """
+        Permite indexar la partición como la tupla (y_train, y_test, X_train, X_test) que devolvía
+        dividir_data, materializando solo los conjuntos pedidos.
+
+        Args:
+        indice (int o slice): Posición o rango de posiciones.
+
+        Returns:
+        DataFrame, Series o tuple: El conjunto pedido, o una tupla si indice es un slice.
+        """
+        if isinstance(indice, slice):
+            return tuple(getattr(self, nombre) for nombre in self.orden_tupla[indice])
+        return getattr(self, self.orden_tupla[indice])
+
+    @staticmethod
+    def aleatoria(datos, test_size=0.2, generador=None, estratificar=False):
+        """
+        Genera una partición aleatoria en entrenamiento y prueba.
+
+        Args:
+        datos (DataFrame): Conjunto de datos completo, con la columna 'y'.
+        test_size (float): Proporción del conjunto de prueba. Por defecto es 0.2.
+        generador (numpy.random.Generator o int, opcional): Generador aleatorio o semilla.
+        estratificar (bool): Si se conserva la proporción de cada valor de 'y' en ambos conjuntos. Por defecto es False.
+
+        Returns:
+        Particion: La partición generada.
+        """
+        generador = np.random.default_rng(generador)
+        train, test = [], []
+        for grupo in Particion.estratos(datos, estratificar):
+            grupo = generador.permutation(grupo)
+            n_train = int(len(grupo) * (1 - test_size))
+            train.append(grupo[:n_train])
+            test.append(grupo[n_train:])
+        return Particion(datos, np.sort(np.concatenate(train)), np.sort(np.concatenate(test)))
+
+    @staticmethod
+    def k_fold(datos, k=5, generador=None, estratificar=False, repeticiones=1):
+        """
+        Genera las particiones de una validación cruzada en k pliegues, opcionalmente repetida.
+
+        Args:
+        datos (DataFrame): Conjunto de datos completo, con la columna 'y'.
+        k (int): Cantidad de pliegues. Por defecto es 5.
+        generador (numpy.random.Generator o int, opcional): Generador aleatorio o semilla.
+        estratificar (bool): Si se conserva la proporción de cada valor de 'y' en cada pliegue. Por defecto es False.
+        repeticiones (int): Cantidad de veces que se repite la división en k pliegues. Por defecto es 1.
+
+        Returns:
+        list: Lista de k * repeticiones particiones; en cada una el pliegue correspondiente es el de prueba.
+        """
+        generador = np.random.default_rng(generador)
+        particiones = []
+        for _ in range(repeticiones):
+            pliegues = np.empty(len(datos), dtype=np.intp)
+            desfasaje = 0
+            for grupo in Particion.estratos(datos, estratificar):
+                grupo = generador.permutation(grupo)
+                pliegues[grupo] = (np.arange(len(grupo)) + desfasaje) % k
+                desfasaje += len(grupo)
+            for pliegue in range(k):
+                particiones.append(Particion(datos, np.flatnonzero(pliegues != pliegue), np.flatnonzero(pliegues == pliegue)))
+        return particiones
+
+    @staticmethod
+    def estratos(datos, estratificar):
+        """
+        Devuelve las posiciones de las filas agrupadas por valor de 'y' (o todas juntas si no se estratifica).
+
+        Args:
+        datos (DataFrame): Conjunto de datos completo, con la columna 'y'.
+        estratificar (bool): Si se agrupa por valor de 'y'.
+
+        Returns:
+        list: Arreglos de posiciones, uno por estrato.
+        """
+        if not estratificar:
+            return [np.arange(len(datos))]
+        codigos = pd.factorize(datos['y'])[0]
+        orden = np.argsort(codigos, kind='stable')
+        return np.split(orden, np.flatnonzero(np.diff(codigos[orden])) + 1)
+
+class AcumuladorClasificacion:
+    """
+    Acumula matrices de confusión por umbral y un histograma de probabilidades por clase, bloque a bloque.
+
+    Las matrices de confusión en los umbrales indicados son exactas. El AUC se aproxima con los
+    histogramas de probabilidades de positivos y negativos: los pares que caen en el mismo
+    intervalo se cuentan como empates, por lo que el error está acotado por la suma de esos pares
+    sobre (positivos * negativos) / 2, cota que se informa junto con el AUC. Dos acumuladores
+    con los mismos umbrales e intervalos se combinan sumando sus cuentas.
+
+    Atributos:
+    umbrales (numpy.ndarray): Umbrales ordenados; se clasifica como 1 si proba >= umbral.
+    bins (int): Cantidad de intervalos del histograma en [0, 1].
+    positivos (numpy.ndarray): Cantidad de positivos con proba >= cada umbral.
+    negativos (numpy.ndarray): Cantidad de negativos con proba >= cada umbral.
+    hist_positivos (numpy.ndarray): Histograma de probabilidades de los positivos.
+    hist_negativos (numpy.ndarray): Histograma de probabilidades de los negativos.
+    """
+
+    def __init__(self, umbrales=(0.5,), bins=1000):
+        """
+        Inicializa un acumulador vacío.
+
+        Args:
+        umbrales (array-like): Umbrales en los que se cuentan las matrices de confusión. Por defecto es (0.5,).
+        bins (int): Cantidad de intervalos del histograma. Por defecto es 1000.
+        """
+        self.umbrales = np.sort(np.asarray(umbrales, dtype=float))
+        self.bins = bins
+        self.positivos = np.zeros(len(self.umbrales))
+        self.negativos = np.zeros(len(self.umbrales))
+        self.hist_positivos = np.zeros(bins)
+        self.hist_negativos = np.zeros(bins)
+
+    def actualizar(self, proba, y):
+        """
+        Incorpora un bloque de probabilidades predichas y valores observados.
+
+        Args:
+        proba (array-like): Probabilidades predichas.
+        y (array-like): Valores observados (0 o 1).
+
+        Returns:
+        AcumuladorClasificacion: El mismo acumulador, actualizado.
+        """
+        proba = np.asarray(proba, dtype=float)
+        es_positivo = np.asarray(y) == 1
+        for mascara, mayores, histograma in ((es_positivo, self.positivos, self.hist_positivos),
+                                             (~es_positivo, self.negativos, self.hist_negativos)):
+            p = proba[mascara]
+            # Cantidad de umbrales <= p: el dato se clasifica como 1 en todos esos umbrales
+            superados = np.bincount(np.searchsorted(self.umbrales, p, side='right'), minlength=len(self.umbrales) + 1)
+            mayores += np.cumsum(superados[1:][::-1])[::-1]
+            intervalos = np.clip((p * self.bins).astype(np.intp), 0, self.bins - 1)
+            histograma += np.bincount(intervalos, minlength=self.bins)
+        return self
+
+    def combinar(self, otro):
+        """
+        Combina en este acumulador el de otra parte de los datos.
+
+        Args:
+        otro (AcumuladorClasificacion): Acumulador con los mismos umbrales e intervalos.
+
+        Returns:
+        AcumuladorClasificacion: El mismo acumulador, actualizado.
+        """
+        if self.bins != otro.bins or not np.array_equal(self.umbrales, otro.umbrales):
+            raise Exception("Los acumuladores deben tener los mismos umbrales e intervalos para combinarse.")
+        self.positivos += otro.positivos
+        self.negativos += otro.negativos
+        self.hist_positivos += otro.hist_positivos
+        self.hist_negativos += otro.hist_negativos
+        return self
+
+    def metricas(self):
+        """
+        Calcula las métricas acumuladas.
+
+        Returns:
+        dict: Diccionario con la tabla por umbral (vp, fp, fn, vn, error_total, sensibilidad,
+        especificidad), el AUC aproximado y la cota de su error.
+        """
+        total_pos, total_neg = self.hist_positivos.sum(), self.hist_negativos.sum()
+        vp, fp = self.positivos, self.negativos
+        fn, vn = total_pos - vp, total_neg - fp
+        with np.errstate(invalid='ignore', divide='ignore'):
+            tabla = pd.DataFrame({
+                'umbral': self.umbrales, 'vp': vp, 'fp': fp, 'fn': fn, 'vn': vn,
+                'error_total': (fp + fn) / (total_pos + total_neg),
+                'sensibilidad': vp / total_pos,
+                'especificidad': vn / total_neg
+            })
+            negativos_debajo = np.cumsum(self.hist_negativos) - self.hist_negativos
+            pares = total_pos * total_neg
+            auc = np.sum(self.hist_positivos * (negativos_debajo + self.hist_negativos / 2)) / pares
+            cota = np.sum(self.hist_positivos * self.hist_negativos) / (2 * pares)
+        return {'tabla': tabla, 'auc': auc, 'cota_error_auc': cota}
+
 class RegresionLogistica(Regresion):
     """
     Clase para realizar regresiones logísticas.
@@ -566,6 +2972,7 @@ class RegresionLogistica(Regresion):
     - Regresion: Clase base para realizar regresiones.
 
     Atributos:
+    particion (Particion): Índices de entrenamiento y prueba de la división actual.
     X_train (DataFrame): Conjunto de datos de entrenamiento para las variables independientes.
     X_test (DataFrame): Conjunto de datos de prueba para las variables independientes.
     y_train (Series): Conjunto de datos de entrenamiento para la variable dependiente.
@@ -574,71 +2981,390 @@ class RegresionLogistica(Regresion):
 
     Métodos:
     __init__(datos): Inicializa la clase con los datos y divide el conjunto de datos en variables independientes y dependiente.
-    dividir_data(test_size=0.2, seed=None): Divide los datos en conjuntos de entrenamiento y prueba.
-    ajustar(): Ajusta el modelo de regresión logística.
+    dividir_data(test_size=0.2, seed=None, estratificar=False): Divide los datos en conjuntos de entrenamiento y prueba (por índices).
+    dividir_k_fold(k=5, seed=None, estratificar=False, repeticiones=1): Genera particiones para validación cruzada.
+    ajustar(solver='newton', inicio_caliente=True): Ajusta el modelo de regresión logística (newton, irls o lbfgs), con inicio caliente.
     predecir_proba(X): Realiza predicciones de probabilidad con el modelo ajustado.
     predecir(X, umbral=0.5): Realiza predicciones binarias con el modelo ajustado.
     obtener_estadisticas_modelo(): Devuelve estadísticas del modelo ajustado.
     evaluar_modelo(umbral=0.5): Evalúa el modelo utilizando una matriz de confusión y calcula métricas de rendimiento.
+    evaluar_por_bloques(bloques, umbrales=(0.5,)): Evalúa el modelo por bloques con un AcumuladorClasificacion.
+    barrido_umbrales(costo_fp=1, costo_fn=1): Calcula las métricas para todos los umbrales con un único ordenamiento.
     graficar_curva_roc(): Genera y grafica la curva ROC del modelo ajustado.
     """
     def __init__(self, datos):
         super().__init__(datos,datos['y'])
-        self.X_train, self.X_test, self.y_train, self.y_test = None, None, None, None
-        self.X = datos.drop('y', axis=1)
+        self.particion = None
+
+    @property
+    def X(self):
+        """Variables independientes (el mismo DataFrame que self.x, sin copiarlo)."""
+        return self.x
+
+    @property
+    def X_train(self):
+        """Variables independientes de entrenamiento de la partición actual (None si no hay partición)."""
+        return None if self.particion is None else self.particion.X_train
+
+    @X_train.setter
+    def X_train(self, valor):
+        RegresionLogistica.asignacion_de_conjunto('X_train')
+
+    @property
+    def X_test(self):
+        """Variables independientes de prueba de la partición actual (None si no hay partición)."""
+        return None if self.particion is None else self.particion.X_test
+
+    @X_test.setter
+    def X_test(self, valor):
+        RegresionLogistica.asignacion_de_conjunto('X_test')
 
-    def dividir_data(self,test_size = 0.2, seed = None):
+    @property
+    def y_train(self):
+        """Variable dependiente de entrenamiento de la partición actual (None si no hay partición)."""
+        return None if self.particion is None else self.particion.y_train
+
+    @y_train.setter
+    def y_train(self, valor):
+        RegresionLogistica.asignacion_de_conjunto('y_train')
+
+    @property
+    def y_test(self):
+        """Variable dependiente de prueba de la partición actual (None si no hay partición)."""
+        return None if self.particion is None else self.particion.y_test
+
+    @y_test.setter
+    def y_test(self, valor):
+        RegresionLogistica.asignacion_de_conjunto('y_test')
+
+    def invalidar_cache(self):
+        """
+        Descarta las matrices guardadas y la partición actual tras modificar los datos.
+
+        Los índices de la partición se refieren a las filas de los datos anteriores, así que hay que
+        volver a dividir los datos (dividir_data) antes de ajustar.
+        """
+        super().invalidar_cache()
+        self.particion = None
+
+    @staticmethod
+    def asignacion_de_conjunto(nombre):
+        """
+        Informa que los conjuntos de entrenamiento y prueba no se asignan directamente.
+
+        Los conjuntos salen de self.particion (y los ajustes usan sus índices sobre la matriz de
+        diseño), así que asignar uno solo dejaría la partición inconsistente.
+
+        Parámetros:
+        nombre (str): Atributo que se intentó asignar.
+        """
+        raise Exception(f"{nombre} no se puede asignar directamente: use dividir_data() o asigne "
+                        f"self.particion = Particion(datos, indices_train, indices_test).")
+
+    def dividir_data(self,test_size = 0.2, seed = None, estratificar=False):
         """
         Divide los datos en conjuntos de entrenamiento y prueba.
 
+        Solo se guardan los índices de cada conjunto (en self.particion); los DataFrames de
+        entrenamiento y prueba se materializan recién cuando se accede a ellos.
+
         Parámetros:
         test_size (float): Proporción del conjunto de prueba. Por defecto es 0.2.
-        seed (int): Semilla para el generador de números aleatorios. Por defecto es None.
+        seed (int o numpy.random.Generator): Semilla o generador de números aleatorios. Por defecto es None.
+        estratificar (bool): Si se conserva la proporción de cada clase en ambos conjuntos. Por defecto es False.
+
+        Retorna:
+        Particion: La partición, que se puede desempaquetar o indexar como la tupla
+        (y_train, y_test, X_train, X_test).
+        """
+        self.particion = Particion.aleatoria(self.datos, test_size, seed, estratificar)
+        return self.particion
+
+    def dividir_k_fold(self, k=5, seed=None, estratificar=False, repeticiones=1):
+        """
+        Genera las particiones de una validación cruzada en k pliegues, sin copiar los datos.
+
+        Parámetros:
+        k (int): Cantidad de pliegues. Por defecto es 5.
+        seed (int o numpy.random.Generator): Semilla o generador de números aleatorios. Por defecto es None.
+        estratificar (bool): Si se conserva la proporción de cada clase en cada pliegue. Por defecto es False.
+        repeticiones (int): Cantidad de repeticiones de la división. Por defecto es 1.
+
+        Retorna:
+        list: Particiones; cualquiera de ellas se puede asignar a self.particion antes de ajustar y evaluar.
+        """
+        return Particion.k_fold(self.datos, k, seed, estratificar, repeticiones)
+
+    def proba_test(self, tam_bloque=2 ** 16):
+        """
+        Calcula las probabilidades predichas para el conjunto de prueba, por bloques de filas.
+
+        Las filas se toman de la matriz de diseño guardada. El resultado se guarda mientras no
+        cambien el ajuste ni la partición, de modo que
+        evaluar_modelo, barrido_umbrales y graficar_curva_roc puntúan el conjunto de prueba una sola vez.
+
+        Parámetros:
+        tam_bloque (int): Cantidad de filas por bloque. Por defecto es 2 ** 16.
 
         Retorna:
-        tuple: Conjunto de entrenamiento y prueba para las variables dependiente e independientes.
+        np.array: Probabilidades predichas, en el orden de self.particion.indices_test.
+        """
+        cache = getattr(self, '_cache_proba_test', None)
+        if cache is not None and cache[0] is self.resultados and cache[1] is self.particion:
+            return cache[2]
+        from scipy.special import expit
+        indices = self.particion.indices_test
+        X = self.matriz_diseno()
+        betas = np.asarray(self.resultados.params, dtype=float)
+        proba = np.concatenate([expit(X[indices[i:i + tam_bloque]] @ betas)
+                                for i in range(0, len(indices), tam_bloque)] or [np.empty(0)])
+        self._cache_proba_test = (self.resultados, self.particion, proba)
+        return proba
+
+    def evaluar_por_bloques(self, bloques, umbrales=(0.5,), bins=1000, acumulador=None):
         """
-        if seed is not None:
-            random.seed(seed)
-        n = len(self.X)
-        n_train = int(n * (1 - test_size))
-        cuales = random.sample(range(n), n_train)
-        datos_train = self.datos.iloc[cuales]
-        datos_test = self.datos.drop(cuales)
-        self.y_train = datos_train['y']
-        self.y_test = datos_test['y']
-        self.X_train = datos_train.drop('y', axis=1)
-        self.X_test = datos_test.drop('y', axis=1)
+        Evalúa el modelo sobre bloques de datos de prueba sin tenerlos todos en memoria.
 
-        return self.y_train, self.y_test, self.X_train, self.X_test
+        Cada bloque se puntúa una sola vez y se incorpora a un AcumuladorClasificacion, que
+        puede combinarse luego con los de otros procesos.
 
-    def ajustar(self):
+        Parámetros:
+        bloques (iterable): DataFrames con las variables independientes y la columna 'y'.
+        umbrales (array-like): Umbrales en los que se cuentan las matrices de confusión. Por defecto es (0.5,).
+        bins (int): Cantidad de intervalos del histograma usado para el AUC. Por defecto es 1000.
+        acumulador (AcumuladorClasificacion, opcional): Acumulador a continuar. Por defecto se crea uno nuevo.
+
+        Retorna:
+        AcumuladorClasificacion: Acumulador con las cuentas de todos los bloques.
+        """
+        if self.resultados is None:
+            raise Exception("El modelo debe ser ajustado antes de evaluar el modelo.")
+        if acumulador is None:
+            acumulador = AcumuladorClasificacion(umbrales, bins)
+        for bloque in bloques:
+            acumulador.actualizar(self.predecir_proba(bloque[self.X.columns]), bloque['y'])
+        return acumulador
+
+    def ajustar(self, solver='newton', inicio_caliente=True, bloques=None, tam_bloque=2 ** 16,
+                tol=1e-8, max_iter=100):
         """
         Ajusta el modelo de regresión logística.
 
-        Agrega una constante a las variables independientes y ajusta un modelo Logit.
+        Agrega una constante a las variables independientes y ajusta un modelo Logit. Si ya hay
+        resultados con los mismos coeficientes e inicio_caliente es True, la optimización parte de
+        ellos (por ejemplo, al reentrenar tras agregar datos). Los solvers 'irls' y 'lbfgs' no usan
+        statsmodels: recorren los datos por bloques de filas acumulando gradiente y X'WX, por lo que
+        también sirven para datos que no entran en memoria (parámetro bloques). Los datos de cada
+        iteración quedan en self.convergencia.
+
+        Parámetros:
+        solver (str): 'newton' (statsmodels), 'irls' o 'lbfgs'. Por defecto es 'newton'.
+        inicio_caliente (bool): Si se parte de los coeficientes del ajuste anterior. Por defecto es True.
+        bloques (callable, opcional): Función sin argumentos que devuelve un iterable de DataFrames (con la
+            columna 'y') con los datos de entrenamiento; se llama una vez por pasada. Solo para los solvers
+            'irls' y 'lbfgs'. Por defecto se usan X_train e y_train.
+        tam_bloque (int): Filas por bloque cuando se usan X_train e y_train. Por defecto es 2 ** 16.
+        tol (float): Tolerancia sobre el paso (irls) o el gradiente (lbfgs). Por defecto es 1e-8.
+        max_iter (int): Cantidad máxima de iteraciones. Por defecto es 100.
+
+        Retorna:
+        self.resultados (LogitResults o ResultadosLogit): Resultados del ajuste del modelo.
         """
-        if self.X_train is None or self.y_train is None:
+        if bloques is not None and solver == 'newton':
+            raise Exception("El parámetro bloques solo se admite con los solvers 'irls' y 'lbfgs'.")
+        if bloques is None and self.particion is None:
             raise Exception("Los datos de entrenamiento deben ser divididos antes de ajustar el modelo.")
-        X_const = sm.add_constant(self.X_train)
-        self.modelo = sm.Logit(self.y_train, X_const)
-        self.resultados = self.modelo.fit()
+        if bloques is None and self.particion.datos is not self.datos:
+            raise Exception("La partición corresponde a otros datos: vuelva a dividir los datos antes de ajustar el modelo.")
+        columnas = list(self.X.columns)
+        inicio = None
+        if inicio_caliente and self.resultados is not None and len(self.resultados.params) == len(columnas) + 1:
+            inicio = np.asarray(self.resultados.params, dtype=float)
+
+        historial = []
+        comienzo = time.perf_counter()
+        if solver == 'newton':
+            import statsmodels.api as sm
+            indices = self.particion.indices_train
+            X_const = pd.DataFrame(self.matriz_diseno()[indices], index=self.y.index[indices],
+                                   columns=['const'] + columnas, copy=False)
+            self.modelo = sm.Logit(self.vector_respuesta()[indices], X_const)
+            self.resultados = self.modelo.fit(start_params=inicio, maxiter=max_iter,
+                                              callback=lambda betas: historial.append(time.perf_counter()))
+            iteraciones = self.resultados.mle_retvals['iterations']
+            convergio = self.resultados.mle_retvals['converged']
+        elif solver in ('irls', 'lbfgs'):
+            if bloques is None:
+                pares = lambda: self.bloques_entrenamiento(tam_bloque)
+            else:
+                pares = lambda: (self.matriz_de_bloque(bloque, columnas) for bloque in bloques())
+            pasada = lambda betas, con_hessiana: RegresionLogistica.pasada_logistica(pares(), betas, con_hessiana)
+            betas = inicio if inicio is not None else np.zeros(len(columnas) + 1)
+            convergio = False
+            if solver == 'irls':
+                for iteraciones in range(1, max_iter + 1):
+                    llf, gradiente, hessiana, n = pasada(betas, True)
+                    paso = np.linalg.lstsq(hessiana, gradiente, rcond=None)[0]
+                    betas = betas + paso
+                    historial.append(time.perf_counter())
+                    if np.max(np.abs(paso)) < tol:
+                        convergio = True
+                        break
+            else:
+                from scipy.optimize import minimize
+
+                def objetivo(b):
+                    llf, gradiente, _, n = pasada(b, False)
+                    return -llf / n, -gradiente / n
+                optimo = minimize(objetivo, betas, jac=True,
+                                  method='L-BFGS-B', options={'maxiter': max_iter, 'gtol': tol, 'ftol': 1e-15},
+                                  callback=lambda b: historial.append(time.perf_counter()))
+                betas, iteraciones, convergio = optimo.x, optimo.nit, bool(optimo.success)
+            llf, gradiente, hessiana, n = pasada(betas, True)
+            self.modelo = None
+            self.resultados = ResultadosLogit(['const'] + columnas, betas, hessiana, llf, n)
+        else:
+            raise Exception(f"Solver desconocido: {solver}. Opciones: newton, irls, lbfgs.")
+        tiempo_total = time.perf_counter() - comienzo
+        tiempos = np.diff([comienzo] + historial)
+        self.convergencia = {
+            'solver': solver,
+            'inicio_caliente': inicio is not None,
+            'iteraciones': int(iteraciones),
+            'convergio': bool(convergio),
+            'tiempo_total': tiempo_total,
+            'tiempo_por_iteracion': tiempos
+        }
         return self.resultados
 
+    @staticmethod
+    def metricas_pliegue(X_train, y_train, X_test, y_test, parametros, tol=1e-8, max_iter=100):
+        """
+        Ajusta el modelo logístico (IRLS) con un pliegue de entrenamiento y lo evalúa en el de prueba.
+
+        Parámetros:
+        X_train (numpy.ndarray): Matriz de diseño de entrenamiento (con la constante).
+        y_train (numpy.ndarray): Variable dependiente de entrenamiento.
+        X_test (numpy.ndarray): Matriz de diseño de prueba (con la constante).
+        y_test (numpy.ndarray): Variable dependiente de prueba.
+        parametros (dict): Configuración de la grilla; 'umbral' (por defecto 0.5) para clasificar.
+        tol (float): Tolerancia sobre el paso de IRLS. Por defecto es 1e-8.
+        max_iter (int): Cantidad máxima de iteraciones. Por defecto es 100.
+
+        Retorna:
+        dict: Diccionario con error_total, sensibilidad, especificidad y AUC.
+        """
+        from scipy.special import expit
+        from scipy.stats import rankdata
+        betas = np.zeros(X_train.shape[1])
+        for _ in range(max_iter):
+            _, gradiente, hessiana, _ = RegresionLogistica.pasada_logistica([(X_train, y_train)], betas, True)
+            paso = np.linalg.lstsq(hessiana, gradiente, rcond=None)[0]
+            betas = betas + paso
+            if np.max(np.abs(paso)) < tol:
+                break
+        proba = expit(X_test @ betas)
+        predicciones = proba >= parametros.get('umbral', 0.5)
+        positivos = y_test == 1
+        a = np.sum(predicciones & positivos)
+        b = np.sum(predicciones & ~positivos)
+        c = np.sum(~predicciones & positivos)
+        d = np.sum(~predicciones & ~positivos)
+        # AUC como estadístico de Mann-Whitney sobre los rangos de las probabilidades
+        rangos = rankdata(proba)
+        n_pos, n_neg = positivos.sum(), (~positivos).sum()
+        auc = (rangos[positivos].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg) if n_pos and n_neg else np.nan
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return {
+                'error_total': (b + c) / len(y_test),
+                'sensibilidad': a / (a + c),
+                'especificidad': d / (d + b),
+                'AUC': auc
+            }
+
+    def bloques_entrenamiento(self, tam_bloque):
+        """
+        Recorre los datos de entrenamiento por bloques de filas de la matriz de diseño guardada.
+
+        Parámetros:
+        tam_bloque (int): Cantidad de filas por bloque.
+
+        Retorna:
+        generator: Pares (X, y) de cada bloque, con la constante incluida en X.
+        """
+        indices = self.particion.indices_train
+        X, y = self.matriz_diseno(), self.vector_respuesta()
+        for inicio in range(0, len(indices), tam_bloque):
+            filas = indices[inicio:inicio + tam_bloque]
+            yield X[filas], y[filas]
+
+    @staticmethod
+    def matriz_de_bloque(bloque, columnas):
+        """
+        Arma la matriz de diseño (con la constante) y el vector y de un bloque.
+
+        Parámetros:
+        bloque (DataFrame): Bloque con las columnas independientes y la columna 'y'.
+        columnas (list): Columnas independientes, en el orden de los coeficientes.
+
+        Retorna:
+        tuple: Matriz de diseño y vector y, como arreglos float64.
+        """
+        X = np.empty((len(bloque), len(columnas) + 1))
+        X[:, 0] = 1.0
+        X[:, 1:] = bloque[columnas].to_numpy(dtype=float)
+        return X, bloque['y'].to_numpy(dtype=float)
+
+    @staticmethod
+    def pasada_logistica(bloques, betas, con_hessiana):
+        """
+        Recorre los bloques una vez y acumula log-verosimilitud, gradiente y, opcionalmente, X'WX.
+
+        Parámetros:
+        bloques (iterable): Pares (X, y) con la constante incluida en X.
+        betas (numpy.ndarray): Coeficientes en los que se evalúa.
+        con_hessiana (bool): Si se acumula la matriz de información X'WX.
+
+        Retorna:
+        tuple: Log-verosimilitud, gradiente, X'WX (o None) y cantidad de observaciones.
+        """
+        from scipy.special import expit
+        llf, gradiente, hessiana, n = 0.0, np.zeros(len(betas)), None, 0
+        if con_hessiana:
+            hessiana = np.zeros((len(betas), len(betas)))
+        for X, y in bloques:
+            eta = X @ betas
+            mu = expit(eta)
+            llf += np.sum(y * eta - np.logaddexp(0, eta))
+            gradiente += X.T @ (y - mu)
+            if con_hessiana:
+                hessiana += X.T @ (X * (mu * (1 - mu))[:, np.newaxis])
+            n += len(y)
+        return llf, gradiente, hessiana, n
+
     def predecir_proba(self, X):
         """
         Realiza predicciones de probabilidad con el modelo ajustado.
 
+        Los coeficientes se aplican directamente, sin copiar X con sm.add_constant; si X es el propio
+        self.x se usa la matriz de diseño guardada.
+
         Parámetros:
         X (DataFrame): Conjunto de datos para realizar la predicción.
 
         Retorna:
-        np.array: Predicciones de probabilidad.
+        Series o np.array: Predicciones de probabilidad (una Series con el índice de X si X es un DataFrame).
         """
+        from scipy.special import expit
         if self.resultados is None:
             raise Exception("El modelo debe ser ajustado antes de hacer predicciones.")
-        X_const = sm.add_constant(pd.DataFrame(X))
-        return self.resultados.predict(X_const)
+        betas = np.asarray(self.resultados.params, dtype=float)
+        if X is self.x:
+            return pd.Series(expit(self.matriz_diseno() @ betas), index=X.index)
+        if isinstance(X, pd.DataFrame):
+            return pd.Series(expit(betas[0] + X[self.x.columns].to_numpy(dtype=float) @ betas[1:]), index=X.index)
+        X = np.asarray(X, dtype=float)
+        return expit(betas[0] + X @ betas[1:])
 
     def predecir(self, X, umbral=0.5):
         """
@@ -649,7 +3375,7 @@ class RegresionLogistica(Regresion):
         umbral (float): Umbral para la clasificación binaria. Por defecto es 0.5.
 
         Retorna:
-        np.array: Predicciones binarias.
+        Series o np.array: Predicciones binarias (una Series con el índice de X si X es un DataFrame).
         """
         proba = self.predecir_proba(X)
         return (proba >= umbral).astype(int)
@@ -686,10 +3412,12 @@ class RegresionLogistica(Regresion):
         Retorna:
         dict: Diccionario con la matriz de confusión
         """
+        from sklearn.metrics import confusion_matrix
         if self.resultados is None:
             raise Exception("El modelo debe ser ajustado antes de evaluar el modelo.")
-        predicciones = self.predecir(self.X_test, umbral)
-        matriz_confusion = confusion_matrix(self.y_test, predicciones)
+        predicciones = (self.proba_test() >= umbral).astype(int)
+        y_test = self.y.to_numpy()[self.particion.indices_test]
+        matriz_confusion = confusion_matrix(y_test, predicciones, labels=[0, 1])
         d, b,c, a = matriz_confusion.ravel()
         error_total = (b + c) / (d + b + c + a)
         sensibilidad = a / (a + c)
@@ -706,30 +3434,122 @@ class RegresionLogistica(Regresion):
             'especificidad': especificidad
         }
 
-    def graficar_curva_roc(self):
+    def barrido_umbrales(self, costo_fp=1.0, costo_fn=1.0, proba=None, y=None):
+        """
+        Calcula las métricas de clasificación para todos los umbrales distintos con un único ordenamiento.
+
+        Las probabilidades se ordenan una vez de mayor a menor; los verdaderos y falsos positivos
+        de cada umbral (clasificando como 1 si proba >= umbral) salen de sumas acumuladas, por lo
+        que el costo total es O(n log n). La curva ROC y el AUC se obtienen de la misma pasada.
+
+        Parámetros:
+        costo_fp (float): Costo de un falso positivo. Por defecto es 1.
+        costo_fn (float): Costo de un falso negativo. Por defecto es 1.
+        proba (np.array, opcional): Probabilidades predichas. Por defecto, las del conjunto de prueba.
+        y (np.array, opcional): Valores observados (0 o 1). Por defecto, los del conjunto de prueba.
+
+        Retorna:
+        dict: Diccionario con la tabla por umbral (vp, fp, fn, vn, error_total, sensibilidad,
+        especificidad, precision, youden, costo), el umbral óptimo según el costo y el AUC.
+        """
+        if proba is None:
+            if self.resultados is None:
+                raise Exception("El modelo debe ser ajustado antes de barrer umbrales.")
+            proba = self.proba_test()
+            y = self.y.to_numpy()[self.particion.indices_test]
+        proba = np.asarray(proba, dtype=float)
+        positivos_ordenados = (np.asarray(y) == 1)[np.argsort(-proba, kind='mergesort')]
+        proba_ordenada = -np.sort(-proba)
+        # Último elemento de cada grupo de probabilidades iguales: ahí cambia la clasificación
+        cortes = np.r_[np.flatnonzero(np.diff(proba_ordenada)), len(proba_ordenada) - 1]
+        vp = np.r_[0, np.cumsum(positivos_ordenados)[cortes]]
+        fp = np.r_[0, cortes + 1 - vp[1:]]
+        total_pos, total_neg = positivos_ordenados.sum(), len(positivos_ordenados) - positivos_ordenados.sum()
+        fn, vn = total_pos - vp, total_neg - fp
+        with np.errstate(invalid='ignore', divide='ignore'):
+            tabla = pd.DataFrame({
+                'umbral': np.r_[np.inf, proba_ordenada[cortes]],
+                'vp': vp, 'fp': fp, 'fn': fn, 'vn': vn,
+                'error_total': (fp + fn) / len(proba),
+                'sensibilidad': vp / total_pos,
+                'especificidad': vn / total_neg,
+                'precision': vp / (vp + fp),
+            })
+        tabla['youden'] = tabla['sensibilidad'] + tabla['especificidad'] - 1
+        tabla['costo'] = costo_fp * fp + costo_fn * fn
+        tvp, tfp = tabla['sensibilidad'].to_numpy(), 1 - tabla['especificidad'].to_numpy()
+        auc = np.sum(np.diff(tfp) * (tvp[1:] + tvp[:-1]) / 2)
+        return {
+            'tabla': tabla,
+            'umbral_optimo': tabla['umbral'].iloc[np.argmin(tabla['costo'].to_numpy())],
+            'auc': auc
+        }
+
+    def graficar_curva_roc(self, archivo=None, max_puntos=5000):
         """
         Genera y grafica la curva ROC del modelo ajustado.
 
+        Si la curva tiene más de max_puntos vértices, primero se conserva el último vértice de cada
+        uno de max_puntos intervalos iguales de tasa de falsos positivos (el de mayor tasa de
+        verdaderos positivos, porque la curva es creciente) y se grafica la envolvente convexa de
+        esos puntos (la curva ROC de los clasificadores alcanzables mezclando umbrales). El costo de
+        dibujo depende solo de max_puntos. El AUC informado es siempre el de la curva completa.
+
+        Parámetros:
+        archivo (str, opcional): Ruta del archivo de imagen. Si se indica, el gráfico se guarda en lugar de mostrarse.
+        max_puntos (int, opcional): Cantidad máxima de vértices a graficar. None grafica la curva completa.
+
         Retorna:
         AUC
         """
         if self.resultados is None:
             raise Exception("El modelo debe ser ajustado antes de graficar la curva ROC.")
-        proba_pred = self.predecir_proba(self.X_test)
+        barrido = self.barrido_umbrales()
+        auc = barrido['auc']
+        tfp = 1 - barrido['tabla']['especificidad'].to_numpy() #tfp: Tasa de Falsos Positivos, tvp: Tasa de Verdaderos Positivos
+        tvp = barrido['tabla']['sensibilidad'].to_numpy()
+        if max_puntos is not None and len(tfp) > max_puntos:
+            cortes = np.searchsorted(tfp, np.linspace(0, 1, max_puntos), side='right') - 1
+            cortes = np.unique(np.r_[0, np.clip(cortes, 0, len(tfp) - 1), len(tfp) - 1])
+            tfp, tvp = RegresionLogistica.envolvente_roc(tfp[cortes], tvp[cortes])
+
+        figura, ejes = ResumenGrafico.nueva_figura(archivo)
+        ejes.plot(tfp, tvp, color='blue', label=f'ROC curve (AUC = {auc:.2f})')
+        ejes.plot([0, 1], [0, 1], color='red', linestyle='--')
+        ejes.set_xlabel('Tasa de Falsos Positivos')
+        ejes.set_ylabel('Tasa de Verdaderos Positivos')
+        ejes.set_title('Curva ROC')
+        ejes.legend(loc='lower right')
+        ResumenGrafico.cerrar_figura(figura, archivo)
 
-        tfp, tvp, umbrales = roc_curve(self.y_test, proba_pred) #tfp: Tasa de Falsos Positivos, tvp: Tasa de Verdaderos Positivos
-        auc = roc_auc_score(self.y_test, proba_pred)
+        return auc
+
+    @staticmethod
+    def envolvente_roc(tfp, tvp):
+        """
+        Calcula los vértices de la envolvente convexa superior de una curva ROC.
 
-        plt.figure(figsize=(10, 6))
-        plt.plot(tfp, tvp, color='blue', label=f'ROC curve (AUC = {auc:.2f})')
-        plt.plot([0, 1], [0, 1], color='red', linestyle='--')
-        plt.xlabel('Tasa de Falsos Positivos')
-        plt.ylabel('Tasa de Verdaderos Positivos')
-        plt.title('Curva ROC')
-        plt.legend(loc='lower right')
-        plt.show()
+        Los puntos ya vienen ordenados por tasa de falsos positivos creciente (como los devuelve
+        barrido_umbrales), así que basta una pasada de la cadena monótona de Andrew. La pasada es
+        lineal en la cantidad de puntos; graficar_curva_roc la llama con a lo sumo max_puntos + 2.
 
-        return auc
+        Parámetros:
+        tfp (np.array): Tasas de falsos positivos, crecientes.
+        tvp (np.array): Tasas de verdaderos positivos.
+
+        Retorna:
+        tuple: Tasas de falsos y verdaderos positivos de los vértices de la envolvente.
+        """
+        vertices = []
+        for punto in zip(tfp, tvp):
+            while len(vertices) >= 2:
+                (x1, y1), (x2, y2) = vertices[-2], vertices[-1]
+                if (x2 - x1) * (punto[1] - y1) - (y2 - y1) * (punto[0] - x1) < 0:
+                    break
+                vertices.pop()
+            vertices.append(punto)
+        vertices = np.array(vertices)
+        return vertices[:, 0], vertices[:, 1]
 
 
 class ChiCuadrado:
@@ -738,6 +3558,8 @@ class ChiCuadrado:
 
     Métodos:
     - test: Realiza el test de Chi-cuadrado para los datos observados y las probabilidades esperadas.
+    - test_lote: Realiza muchos tests de bondad de ajuste a la vez y devuelve un arreglo estructurado.
+    - test_independencia: Realiza el test de independencia entre dos variables categóricas con cuentas dispersas.
     """
 
     def __init__(self, datos=None):
@@ -762,13 +3584,8 @@ class ChiCuadrado:
         Prints:
         - Estadístico observado y teórico, p-valor y conclusión del test.
         """
-        n = sum(val_obs)
-        val_esp = [p * n for p in prob]
-        resta = [val_obs[i] - val_esp[i] for i in range(len(val_obs))]
-        X_obs = sum(resta[i] ** 2 / val_esp[i] for i in range(len(val_esp)))
-        gf = len(prob) - 1
-        X_teo = chi2.ppf(1 - alfa, gf)
-        p_valor = 1 - chi2.cdf(X_obs, gf)
+        resultado = self.test_lote(np.atleast_2d(np.asarray(val_obs, dtype=float)), prob, alfa)[0]
+        X_obs, X_teo, p_valor = resultado['estadistico'], resultado['estadistico_teorico'], resultado['p_valor']
         print('Estadístico observado:', X_obs)
         print('Estadístico teórico:', X_teo)
         print('p-valor:', p_valor)
@@ -777,4 +3594,182 @@ class ChiCuadrado:
         elif p_valor <= alfa and X_obs >= X_teo:
             print('Hay evidencia suficiente para rechazar la hipótesis nula')
         else:
-            print('Hay un error, no hay congruencia entre los resultados obtenidos')
\ No newline at end of file
+            print('Hay un error, no hay congruencia entre los resultados obtenidos')
+
+    # Campos del arreglo estructurado devuelto por test_lote
+    tipo_resultado = np.dtype([('estadistico', 'f8'), ('estadistico_teorico', 'f8'), ('p_valor', 'f8'),
+                               ('gl', 'i8'), ('rechaza', '?')])
+
+    def test_lote(self, val_obs, prob, alfa, archivo=None, tam_bloque=2 ** 16):
+        """
+        Realiza muchos tests de Chi-cuadrado de bondad de ajuste a la vez, en forma vectorizada.
+
+        Parámetros:
+        - val_obs (array-like): Matriz de valores observados, una fila por test.
+        - prob (array-like): Probabilidades esperadas, compartidas (un vector) o una fila por test.
+        - alfa (float): Nivel de significancia.
+        - archivo (str, opcional): Ruta a un archivo .npy donde se escriben los resultados por bloques
+          (con np.lib.format.open_memmap), sin mantenerlos todos en memoria.
+        - tam_bloque (int): Cantidad de tests por bloque. Por defecto es 2 ** 16.
+
+        Retorna:
+        - numpy.ndarray: Arreglo estructurado (o np.memmap si se indicó archivo) con el estadístico
+          observado y teórico, el p-valor, los grados de libertad y si se rechaza la hipótesis nula.
+        """
+        from scipy.stats import chi2
+        val_obs = np.atleast_2d(val_obs)
+        prob = np.asarray(prob, dtype=float)
+        cantidad, categorias = val_obs.shape
+        gl = categorias - 1
+        X_teo = chi2.ppf(1 - alfa, gl)
+        if archivo is None:
+            resultados = np.empty(cantidad, dtype=self.tipo_resultado)
+        else:
+            resultados = np.lib.format.open_memmap(archivo, mode='w+', dtype=self.tipo_resultado, shape=(cantidad,))
+        for inicio in range(0, cantidad, tam_bloque):
+            observados = np.asarray(val_obs[inicio:inicio + tam_bloque], dtype=float)
+            p = prob if prob.ndim == 1 else prob[inicio:inicio + tam_bloque]
+            esperados = observados.sum(axis=1, keepdims=True) * p
+            X_obs = np.sum((observados - esperados) ** 2 / esperados, axis=1)
+            bloque = resultados[inicio:inicio + len(observados)]
+            bloque['estadistico'] = X_obs
+            bloque['estadistico_teorico'] = X_teo
+            bloque['p_valor'] = chi2.sf(X_obs, gl)
+            bloque['gl'] = gl
+            bloque['rechaza'] = bloque['p_valor'] <= alfa
+        if archivo is not None:
+            resultados.flush()
+        return resultados
+
+    def test_independencia(self, x=None, y=None, alfa=0.05, tabla=None, permutaciones=0, seed=None, trabajadores=None):
+        """
+        Realiza el test de Chi-cuadrado de independencia entre dos variables categóricas.
+
+        Las etiquetas se codifican con pd.factorize y la tabla de contingencia se guarda solo con
+        sus celdas no nulas. El estadístico se calcula como N * suma(O ** 2 / (fila * columna)) - N
+        directamente sobre esas celdas y los totales por fila y columna, sin armar la tabla densa de
+        valores esperados ni expandir la tabla a una entrada por observación. Con permutaciones > 0
+        también se calcula un p-valor de Monte Carlo permutando y (lo que conserva los marginales),
+        útil cuando hay celdas con pocas observaciones; las permutaciones se reparten entre procesos
+        con flujos aleatorios independientes.
+
+        Parámetros:
+        - x, y (array-like, opcional): Columnas de etiquetas, de igual largo. Las observaciones con
+          alguna etiqueta faltante (NaN o None) se descartan.
+        - alfa (float): Nivel de significancia. Por defecto es 0.05.
+        - tabla (array-like o matriz dispersa de scipy, opcional): Tabla de contingencia, en lugar de x e y.
+        - permutaciones (int): Cantidad de permutaciones para el p-valor de Monte Carlo. Por defecto es 0.
+        - seed (int, opcional): Semilla para las permutaciones.
+        - trabajadores (int, opcional): Cantidad de procesos para las permutaciones. Por defecto es serial.
+
+        Retorna:
+        - dict: Estadístico observado y teórico, grados de libertad, p-valor, p-valor de Monte Carlo
+          (si se pidió) y si se rechaza la hipótesis nula.
+        """
+        from scipy.stats import chi2
+        from scipy import sparse
+        if tabla is not None:
+            tabla = sparse.coo_array(tabla)
+            tabla.sum_duplicates()
+            filas = columnas = None
+        else:
+            filas = pd.factorize(pd.Series(x))[0]
+            columnas = pd.factorize(pd.Series(y))[0]
+            # Las observaciones con alguna etiqueta faltante (código -1) no se cuentan
+            completas = (filas >= 0) & (columnas >= 0)
+            if not completas.all():
+                filas, columnas = filas[completas], columnas[completas]
+            tabla = ChiCuadrado.tabla_contingencia(filas, columnas, filas.max() + 1, columnas.max() + 1)
+        X_obs, r, c = ChiCuadrado.estadistico_tabla(tabla)
+        gl = (r - 1) * (c - 1)
+        X_teo = chi2.ppf(1 - alfa, gl)
+        p_valor = chi2.sf(X_obs, gl)
+        resultado = {'estadistico': X_obs, 'estadistico_teorico': X_teo, 'gl': gl, 'p_valor': p_valor}
+        if permutaciones > 0:
+            if filas is None:
+                # Una observación por unidad de cuenta: solo se necesita para las permutaciones
+                cuentas = tabla.data.astype(np.int64)
+                filas, columnas = np.repeat(tabla.row, cuentas), np.repeat(tabla.col, cuentas)
+            forma = tabla.shape
+            semillas = np.random.SeedSequence(seed).spawn(trabajadores or 1)
+            cantidades = np.diff(np.linspace(0, permutaciones, len(semillas) + 1).astype(int))
+            tareas = [(filas, columnas, forma, X_obs, cantidad, semilla) for cantidad, semilla in zip(cantidades, semillas)]
+            if trabajadores is None:
+                extremos = sum(map(ChiCuadrado.permutaciones_independencia, tareas))
+            else:
+                with ProcessPoolExecutor(trabajadores) as pool:
+                    extremos = sum(pool.map(ChiCuadrado.permutaciones_independencia, tareas))
+            resultado['p_valor_montecarlo'] = (1 + extremos) / (1 + permutaciones)
+            p_valor = resultado['p_valor_montecarlo']
+        resultado['rechaza'] = p_valor <= alfa
+        return resultado
+
+    @staticmethod
+    def tabla_contingencia(filas, columnas, r, c):
+        """
+        Cuenta las observaciones de cada celda y devuelve solo las celdas no nulas.
+
+        Si la tabla densa no es más grande que la cantidad de observaciones, las celdas se cuentan
+        con np.bincount sobre filas * c + columnas; si no, se numeran las celdas ocupadas con
+        pd.factorize y se cuentan con np.bincount sobre esos números.
+
+        Parámetros:
+        - filas (numpy.ndarray): Código de fila de cada observación.
+        - columnas (numpy.ndarray): Código de columna de cada observación.
+        - r, c (int): Cantidad de filas y de columnas.
+
+        Retorna:
+        - scipy.sparse.coo_array: Tabla de contingencia de r x c.
+        """
+        from scipy import sparse
+        codigos = filas.astype(np.int64) * c + columnas
+        if r * c <= max(len(codigos), 2 ** 20):
+            conteos = np.bincount(codigos, minlength=r * c)
+            celdas = np.flatnonzero(conteos)
+            conteos = conteos[celdas]
+        else:
+            # Tabla densa demasiado grande: las celdas ocupadas se numeran por hash, sin ordenar los códigos
+            indices, celdas = pd.factorize(codigos)
+            conteos = np.bincount(indices)
+        return sparse.coo_array((conteos, (celdas // c, celdas % c)), shape=(r, c))
+
+    @staticmethod
+    def estadistico_tabla(tabla):
+        """
+        Calcula el estadístico de Chi-cuadrado de independencia a partir de las celdas no nulas.
+
+        Parámetros:
+        - tabla (scipy.sparse.coo_array): Tabla de contingencia sin celdas duplicadas.
+
+        Retorna:
+        - tuple: Estadístico observado y cantidad de filas y de columnas no vacías.
+        """
+        total_fila = np.asarray(tabla.sum(axis=1), dtype=float).ravel()
+        total_columna = np.asarray(tabla.sum(axis=0), dtype=float).ravel()
+        n = total_fila.sum()
+        ocupadas = tabla.data != 0
+        observados = tabla.data[ocupadas].astype(float)
+        esperados_sin_n = total_fila[tabla.row[ocupadas]] * total_columna[tabla.col[ocupadas]]
+        X_obs = n * np.sum(observados ** 2 / esperados_sin_n) - n
+        return X_obs, np.count_nonzero(total_fila), np.count_nonzero(total_columna)
+
+    @staticmethod
+    def permutaciones_independencia(tarea):
+        """
+        Cuenta cuántas permutaciones de las columnas dan un estadístico al menos tan grande como el observado.
+
+        Parámetros:
+        - tarea (tuple): Códigos de fila y columna, forma de la tabla, estadístico observado,
+          cantidad de permutaciones y SeedSequence del flujo aleatorio.
+
+        Retorna:
+        - int: Cantidad de permutaciones con estadístico mayor o igual al observado.
+        """
+        filas, columnas, (r, c), X_obs, cantidad, semilla = tarea
+        generador = np.random.default_rng(semilla)
+        extremos = 0
+        for _ in range(cantidad):
+            permutadas = generador.permutation(columnas)
+            tabla = ChiCuadrado.tabla_contingencia(filas, permutadas, r, c)
+            extremos += ChiCuadrado.estadistico_tabla(tabla)[0] >= X_obs * (1 - 1e-12)
+        return int(extremos)
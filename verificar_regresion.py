@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Verifica la matriz de diseño guardada de Regresion en secuencias de uso que mezclan ajustes.
+
+Comprueba que, después de ajustar_incremental() y agregar_datos(), los métodos que usan todos
+los datos lancen una excepción clara en lugar de usar self.datos incompletos, y que tras
+invalidar_cache() ajustar, graficar y validacion_cruzada funcionen con matrices del tamaño de
+self.x. En la logística, invalidar_cache() debe descartar la partición de los datos anteriores. El script termina con código 1 si alguna verificación falla.
+
+Uso:
+    python verificar_regresion.py
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from mimodulo import RegresionLineal, RegresionLogistica
+
+
+def generar_datos(n, generador):
+    """
+    Genera un DataFrame con dos variables independientes y la respuesta lineal 'y'.
+
+    Returns:
+    DataFrame: Datos con columnas a, b e y.
+    """
+    datos = pd.DataFrame(generador.normal(size=(n, 2)), columns=['a', 'b'])
+    datos['y'] = 1.0 + datos['a'] - datos['b'] + generador.normal(size=n)
+    return datos
+
+
+def lanza_excepcion(funcion):
+    """
+    Indica si funcion() lanza una excepción.
+
+    Returns:
+    bool: True si se lanzó una excepción.
+    """
+    try:
+        funcion()
+    except Exception:
+        return True
+    return False
+
+
+def main():
+    generador = np.random.default_rng(0)
+    errores = []
+    modelo = RegresionLineal(generar_datos(200, generador), None)
+    archivo = os.path.join(tempfile.mkdtemp(), 'grafico.png')
+
+    modelo.ajustar_incremental()
+    modelo.agregar_datos(generar_datos(50, generador))
+    if modelo.n != len(modelo.x) or modelo.resultados.nobs != 250:
+        errores.append(f'agregar_datos: n={modelo.n}, nobs={modelo.resultados.nobs} (se esperaba 200 y 250)')
+    for nombre, metodo in (('ajustar', modelo.ajustar),
+                           ('graficar', lambda: modelo.graficar(archivo=archivo)),
+                           ('validacion_cruzada', lambda: modelo.validacion_cruzada(k=3))):
+        if not lanza_excepcion(metodo):
+            errores.append(f'{nombre} no lanzó una excepción con filas agregadas fuera de self.datos')
+
+    modelo.invalidar_cache()
+    modelo.ajustar()
+    if modelo.matriz_diseno().shape != (len(modelo.x), modelo.k + 1):
+        errores.append(f'matriz_diseno tiene forma {modelo.matriz_diseno().shape}')
+    modelo.graficar(archivo=archivo)
+    ecm = modelo.validacion_cruzada(k=3)['ECM']
+    if len(ecm) != 3 or not np.all(np.isfinite(ecm)):
+        errores.append('validacion_cruzada no devolvió un ECM finito por pliegue')
+
+    datos = generar_datos(200, generador)
+    datos['y'] = (datos['y'] > 1).astype(int)
+    logistica = RegresionLogistica(datos)
+    logistica.dividir_data(seed=0)
+    logistica.datos = datos.iloc[:120].copy()
+    logistica.invalidar_cache()
+    if logistica.particion is not None or not lanza_excepcion(lambda: logistica.ajustar(solver='irls')):
+        errores.append('invalidar_cache no descartó la partición de los datos anteriores')
+    logistica.dividir_data(seed=0)
+    logistica.ajustar(solver='irls')
+    if len(logistica.proba_test()) != len(logistica.particion.indices_test):
+        errores.append('proba_test no coincide con la partición nueva')
+
+    for error in errores:
+        print('ERROR:', error)
+    print('OK' if not errores else f'{len(errores)} verificaciones fallaron')
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())